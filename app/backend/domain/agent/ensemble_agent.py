@@ -67,6 +67,8 @@ class EnsemblePokerAgent:
 
         # Tournament history for exploit analysis (all completed hands)
         self._tournament_history: list[HandRecord] = []
+        # Prompt text of each hand above, formatted once on first use
+        self._formatted_hands: list[str] = []
 
         logger.info(
             f"🎭 Created EnsemblePokerAgent for {player_id} "
@@ -316,7 +318,7 @@ class EnsemblePokerAgent:
 
     def _build_tournament_history(self) -> str:
         """Build full tournament history for exploitation analysis."""
-        return build_tournament_history_prompt(self._tournament_history)
+        return build_tournament_history_prompt(self._tournament_history, self._formatted_hands)
 
     def add_hand_to_history(self, hand_record: HandRecord) -> None:
         """Add a completed hand to tournament history.
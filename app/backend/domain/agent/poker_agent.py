@@ -115,6 +115,8 @@ class PokerAgent:
 
         # Tournament history for exploitation (informed agents only)
         self._tournament_history: list[HandRecord] = []
+        # Prompt text of each hand above, formatted once on first use
+        self._formatted_hands: list[str] = []
 
         # OpenAI client uses environment variables set by Settings.configure_openai_client()
         # No need for conditional logic - OPENAI_BASE_URL and OPENAI_API_KEY are set automatically
@@ -395,7 +397,9 @@ class PokerAgent:
             # Add tournament history for exploitation
             if self._tournament_history:
                 lines.append("")
-                lines.append(build_tournament_history_prompt(self._tournament_history))
+                lines.append(
+                    build_tournament_history_prompt(self._tournament_history, self._formatted_hands)
+                )
 
         return "\n".join(lines)
 
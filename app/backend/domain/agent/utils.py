@@ -279,50 +279,75 @@ def get_detailed_tool_usage(result) -> list[dict]:
     return tool_details
 
 
-def build_tournament_history_prompt(tournament_history: list) -> str:
+def format_hand_history(hand) -> str:
     """
-    Build full tournament history prompt for exploitation analysis.
+    Format one completed hand for the tournament history prompt.
 
     Opponent hole cards are hidden except for showdown hands where
     they were legitimately revealed.
 
     Args:
-        tournament_history: List of HandRecord objects from previous hands
+        hand: HandRecord of a completed hand
 
     Returns:
-        Formatted string containing all previous hands in the tournament.
+        The hand's block of the tournament history, starting with its heading.
     """
-    if not tournament_history:
-        return "No previous hands in this tournament."
+    lines = [f"\n### Hand {hand.hand_number}"]
+    lines.append(f"Blinds: {hand.small_blind}/{hand.big_blind}")
+    lines.append(f"Starting Stacks: {hand.starting_stacks}")
+
+    # Actions by street
+    current_street = None
+    for action in hand.actions:
+        if action.street != current_street:
+            current_street = action.street
+            lines.append(f"\n=== {current_street.upper()} ===")
+
+        if action.amount and action.amount > 0:
+            lines.append(f"  {action.actor}: {action.action_type} {action.amount:.0f}")
+        else:
+            lines.append(f"  {action.actor}: {action.action_type}")
 
-    lines = ["## Tournament History (Previous Hands)"]
+    # Result
+    lines.append(f"\nResult: {hand.finishing_stacks}")
 
-    for hand in tournament_history:
-        lines.append(f"\n### Hand {hand.hand_number}")
-        lines.append(f"Blinds: {hand.small_blind}/{hand.big_blind}")
-        lines.append(f"Starting Stacks: {hand.starting_stacks}")
+    # Showdown hands (legitimately revealed)
+    if hand.shown_hands:
+        if hand.community_cards:
+            lines.append(f"Board: {' '.join(hand.community_cards)}")
+        lines.append("Showdown:")
+        for player, cards in hand.shown_hands.items():
+            lines.append(f"  {player}: {' '.join(cards)}")
 
-        # Actions by street
-        current_street = None
-        for action in hand.actions:
-            if action.street != current_street:
-                current_street = action.street
-                lines.append(f"\n=== {current_street.upper()} ===")
+    return "\n".join(lines)
 
-            if action.amount and action.amount > 0:
-                lines.append(f"  {action.actor}: {action.action_type} {action.amount:.0f}")
-            else:
-                lines.append(f"  {action.actor}: {action.action_type}")
 
-        # Result
-        lines.append(f"\nResult: {hand.finishing_stacks}")
+def build_tournament_history_prompt(
+    tournament_history: list, formatted_hands: list[str] | None = None
+) -> str:
+    """
+    Build full tournament history prompt for exploitation analysis.
 
-        # Showdown hands (legitimately revealed)
-        if hand.shown_hands:
-            if hand.community_cards:
-                lines.append(f"Board: {' '.join(hand.community_cards)}")
-            lines.append("Showdown:")
-            for player, cards in hand.shown_hands.items():
-                lines.append(f"  {player}: {' '.join(cards)}")
+    Opponent hole cards are hidden except for showdown hands where
+    they were legitimately revealed.
 
-    return "\n".join(lines)
+    Args:
+        tournament_history: List of HandRecord objects from previous hands
+        formatted_hands: Optional cache of format_hand_history() blocks for the
+            start of an append-only tournament_history. Only hands beyond it are
+            formatted (and appended to it), so earlier hands are formatted once
+            and the prompt prefix stays byte-identical between decisions.
+
+    Returns:
+        Formatted string containing all previous hands in the tournament.
+    """
+    if not tournament_history:
+        return "No previous hands in this tournament."
+
+    if formatted_hands is None:
+        formatted_hands = []
+    formatted_hands.extend(
+        format_hand_history(hand) for hand in tournament_history[len(formatted_hands) :]
+    )
+
+    return "\n".join(["## Tournament History (Previous Hands)", *formatted_hands])
@@ -92,8 +92,12 @@ class PokerEnvironment:
 
         # Current state
         self._state = None
+        self._hand_complete = True  # Mirrors `not self._state.status`, updated on transitions
         self._hand_number = 0
         self._action_history: list[dict[str, Any]] = []
+        # Snapshots from get_structured_state, keyed by hero seat; cleared on every
+        # state change so repeated reads within one step reuse the same object
+        self._state_cache: dict[int, StructuredGameState] = {}
 
         # Track stacks across hands (for tournament mode)
         self._current_stacks = [float(starting_stack)] * self.num_players
@@ -102,6 +106,8 @@ class PokerEnvironment:
         # _active_original_seats: list of original seat indices that are still in play
         # When a player busts, they're removed from this list
         self._active_original_seats: list[int] = list(range(self.num_players))
+        # Reverse lookup: original seat -> PokerKit seat (None once eliminated)
+        self._original_to_pokerkit: list[int | None] = list(range(self.num_players))
 
     def set_blinds(self, small_blind: int, big_blind: int) -> None:
         """
@@ -121,8 +127,35 @@ class PokerEnvironment:
             min_bet=big_blind,
         )
 
+        self._state_cache.clear()
+
         logger.info(f"Blinds updated to {small_blind}/{big_blind}")
 
+    def reset(self, stacks: list[float] | None = None) -> StructuredGameState:
+        """
+        Reset tournament progress and start the first hand.
+
+        Reuses the player setup and game template instead of building a new
+        environment, so the same table can be replayed from scratch.
+
+        Args:
+            stacks: Stacks per original seat. If None, everyone gets starting_stack.
+
+        Returns:
+            The initial game state of the first hand.
+        """
+        self._state = None
+        self._hand_complete = True
+        self._hand_number = 0
+        self._action_history = []
+        if stacks is None:
+            self._current_stacks = [float(self.starting_stack)] * self.num_players
+        else:
+            self._current_stacks = [float(s) for s in stacks]
+        self._active_original_seats = list(range(self.num_players))
+        self._original_to_pokerkit = list(range(self.num_players))
+        return self.start_hand()
+
     def start_hand(self, stacks: list[float] | None = None) -> StructuredGameState:
         """
         Start a new hand.
@@ -140,12 +173,21 @@ class PokerEnvironment:
         """
         self._hand_number += 1
         self._action_history = []
+        self._state_cache.clear()
 
         # Use provided stacks or current stacks
         hand_stacks = stacks if stacks is not None else self._current_stacks
 
-        # Update active seats: remove any players who have been eliminated (stack <= 0)
-        self._active_original_seats = [i for i in range(self.num_players) if hand_stacks[i] > 0]
+        # Update active seats: remove any players who have been eliminated (stack <= 0),
+        # building both seat mappings in the same pass over the stacks
+        active_seats: list[int] = []
+        original_to_pokerkit: list[int | None] = [None] * self.num_players
+        for orig_seat in range(self.num_players):
+            if hand_stacks[orig_seat] > 0:
+                original_to_pokerkit[orig_seat] = len(active_seats)
+                active_seats.append(orig_seat)
+        self._active_original_seats = active_seats
+        self._original_to_pokerkit = original_to_pokerkit
 
         if len(self._active_original_seats) < 2:
             raise ValueError("Not enough active players to start a hand")
@@ -174,6 +216,8 @@ class PokerEnvironment:
             raw_starting_stacks=active_stacks,
             player_count=active_count,
         )
+        # Automations may finish the hand immediately (e.g. everyone all-in on the blinds)
+        self._hand_complete = not self._state.status
 
         active_names = [self.player_names[i] for i in self._active_original_seats]
         logger.debug(
@@ -193,19 +237,16 @@ class PokerEnvironment:
 
         Returns None if the player has been eliminated.
         """
-        try:
-            return self._active_original_seats.index(original_index)
-        except ValueError:
-            return None  # Player has been eliminated
+        if 0 <= original_index < self.num_players:
+            return self._original_to_pokerkit[original_index]
+        return None
 
     def get_current_actor_index(self) -> int | None:
         """Get the ORIGINAL index of the player who needs to act, or None if no action needed.
 
         Returns the original seat index (consistent with player_names), not the PokerKit index.
         """
-        if self._state is None:
-            return None
-        if not self._state.status:
+        if self._hand_complete:
             return None
         # Convert PokerKit index back to original index
         pk_index = self._state.actor_index
@@ -220,9 +261,38 @@ class PokerEnvironment:
 
     def is_hand_complete(self) -> bool:
         """Check if the current hand is complete."""
-        if self._state is None:
-            return True
-        return not self._state.status
+        return self._hand_complete
+
+    def get_legal_actions(self) -> list[ActionType]:
+        """Get legal actions for the current actor without building a full game state."""
+        return self._get_legal_actions()
+
+    def run_to_completion(
+        self,
+        priority: tuple[ActionType, ...] = (ActionType.FOLD, ActionType.CHECK, ActionType.CALL),
+    ) -> int:
+        """
+        Play out the current hand with a fixed policy.
+
+        Each actor takes the first action in priority that is legal, calling
+        if none of them are.
+
+        Args:
+            priority: Action types in order of preference
+
+        Returns:
+            Number of actions executed.
+        """
+        executed = 0
+        while not self.is_hand_complete():
+            actor = self.get_current_actor_index()
+            if actor is None:
+                break
+            legal = self._get_legal_actions()
+            action_type = next((a for a in priority if a in legal), ActionType.CALL)
+            self.execute_action(actor, Action(type=action_type))
+            executed += 1
+        return executed
 
     def get_structured_state(self, hero_seat: int) -> StructuredGameState:
         """
@@ -243,6 +313,10 @@ class PokerEnvironment:
         if self._state is None:
             raise ValueError("No active hand. Call start_hand() first.")
 
+        cached = self._state_cache.get(hero_seat)
+        if cached is not None:
+            return cached
+
         state = self._state
 
         # Determine current street
@@ -305,7 +379,7 @@ class PokerEnvironment:
         # Button is always at position num_players - 1 in PokerKit's positional setup
         button_seat = self.num_players - 1
 
-        return StructuredGameState(
+        structured = StructuredGameState(
             hand_number=self._hand_number,
             button_seat=button_seat,
             small_blind=float(self.small_blind),
@@ -321,6 +395,8 @@ class PokerEnvironment:
             legal_actions=legal_actions,
             action_history=self._action_history.copy(),
         )
+        self._state_cache[hero_seat] = structured
+        return structured
 
     def execute_action(self, player_index: int, action: Action) -> dict[str, Any]:
         """
@@ -352,6 +428,7 @@ class PokerEnvironment:
 
         state = self._state
         result = {"player": player_index, "action": action.type.value}
+        self._state_cache.clear()
 
         # Capture pot and stacks BEFORE executing the action (using original indices)
         pot_before_action = float(state.total_pot_amount)
@@ -403,6 +480,8 @@ class PokerEnvironment:
             result["error"] = str(e)
             raise
 
+        self._hand_complete = not state.status
+
         # Record in action history with enhanced context
         self._action_history.append(
             {
@@ -2,27 +2,57 @@
 Equity calculation utilities for EV tracking.
 
 Calculates exact equity when hands are known (for showdown analysis).
-Supports both heads-up and multi-way pots.
+Supports both heads-up and multi-way pots. Hands are scored with the integer
+evaluator in hand_evaluator; PokerKit cards are only used by cards_to_pokerkit.
 """
 
+import math
 import random
+from functools import lru_cache
+from itertools import chain, combinations
 
 from pokerkit import Card as PKCard
-from pokerkit import Deck, StandardHighHand
 
+from backend.domain.game.hand_evaluator import (
+    RANKS,
+    SUITS,
+    card_index,
+    card_indices,
+    evaluate_hand,
+)
 from backend.domain.game.models import Card
 from backend.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Every card index, copied per calculation to build the live deck
+_DECK = tuple(range(52))
+
+# PokerKit cards (immutable) indexed by card_index(), parsed once at import
+_PK_CARDS: tuple[PKCard, ...] = tuple(
+    next(iter(PKCard.parse(f"{rank}{suit}"))) for rank in RANKS for suit in SUITS
+)
+
+# Dedicated generator for Monte Carlo runouts
+_rng = random.Random()
+
+# Boards missing at most this many cards are enumerated exactly instead of sampled
+MAX_EXHAUSTIVE_CARDS = 2
+
+# Monte Carlo draws runouts in batches and stops early once the 95% confidence
+# half-width of the estimate is below MC_TARGET_CI
+MC_BATCH_SIZE = 256
+MC_TARGET_CI = 0.02
+_Z95 = 1.96
+_Z95_SQUARED = _Z95 * _Z95
+
+# Canonical deals whose equity is kept in memory
+EQUITY_CACHE_SIZE = 65536
+
 
 def cards_to_pokerkit(cards: list[Card]) -> list[PKCard]:
     """Convert our Card objects to PokerKit Card objects."""
-    result = []
-    for card in cards:
-        card_str = f"{card.rank}{card.suit}"
-        result.extend(PKCard.parse(card_str))
-    return result
+    return [_PK_CARDS[card_index(card)] for card in cards]
 
 
 def calculate_showdown_equity(
@@ -34,7 +64,8 @@ def calculate_showdown_equity(
     Calculate exact equity at showdown when both hands are known (heads-up).
 
     For complete boards (5 cards), this is deterministic.
-    For incomplete boards, uses Monte Carlo simulation with known cards blocked.
+    On the flop and turn every runout is enumerated, so the result is exact.
+    Preflop, uses Monte Carlo simulation with known cards blocked.
 
     Args:
         hero_cards: Hero's hole cards (2 cards)
@@ -57,7 +88,10 @@ def calculate_multiway_equity(
     Calculate hero's equity against multiple opponents at showdown.
 
     For complete boards (5 cards), this is deterministic.
-    For incomplete boards, uses Monte Carlo simulation.
+    On the flop and turn every runout is enumerated, so the result is exact.
+    Preflop, uses Monte Carlo simulation. Flop, turn and preflop results are
+    cached per suit-isomorphic deal, so e.g. AsAh vs KsKh and AcAd vs KcKd
+    share an entry.
 
     Args:
         hero_cards: Hero's hole cards (2 cards)
@@ -67,95 +101,184 @@ def calculate_multiway_equity(
     Returns:
         Hero's equity as a float between 0.0 and 1.0
     """
-    hero_pk = cards_to_pokerkit(hero_cards)
-    opponents_pk = [cards_to_pokerkit(h) for h in opponent_hands]
-    board_pk = cards_to_pokerkit(board_cards) if board_cards else []
+    hero = card_indices(hero_cards)
+    opponents = [card_indices(h) for h in opponent_hands]
+    board = card_indices(board_cards)
 
-    # If we have all 5 board cards, calculate deterministically
-    if len(board_pk) == 5:
-        return _calculate_multiway_deterministic(hero_pk, opponents_pk, board_pk)
+    # River showdowns are a single comparison, cheaper than a cache lookup
+    if len(board) == 5:
+        return _calculate_multiway_deterministic(hero, opponents, board)
+
+    return _cached_equity(*_canonical_deal(hero, opponents, board))
+
+
+def _canonical_deal(
+    hero: list[int],
+    opponents: list[list[int]],
+    board: list[int],
+) -> tuple[tuple[int, ...], tuple[tuple[int, ...], ...], tuple[int, ...]]:
+    """
+    Relabel suits in order of first appearance so isomorphic deals compare equal.
+
+    Each hand and the board is sorted highest card first before relabeling,
+    since card order within them does not affect equity.
+    """
+    suit_map: dict[int, int] = {}
+
+    def relabel(cards: list[int]) -> tuple[int, ...]:
+        return tuple(
+            (card & ~3) | suit_map.setdefault(card & 3, len(suit_map))
+            for card in sorted(cards, reverse=True)
+        )
+
+    return relabel(hero), tuple(relabel(opp) for opp in opponents), relabel(board)
+
+
+@lru_cache(maxsize=EQUITY_CACHE_SIZE)
+def _cached_equity(
+    hero_key: tuple[int, ...],
+    opponents_key: tuple[tuple[int, ...], ...],
+    board_key: tuple[int, ...],
+) -> float:
+    """Equity for a canonical deal from _canonical_deal()."""
+    hero = list(hero_key)
+    opponents = [list(opp) for opp in opponents_key]
+    board = list(board_key)
+
+    # One or two cards to come is at most C(45, 2) = 990 runouts - enumerate them all
+    if 5 - len(board) <= MAX_EXHAUSTIVE_CARDS:
+        return _calculate_multiway_exhaustive(hero, opponents, board)
 
     # Otherwise, use Monte Carlo with dead cards
-    return _calculate_multiway_monte_carlo(hero_pk, opponents_pk, board_pk)
+    return _calculate_multiway_monte_carlo(hero, opponents, board)
+
+
+def _player_hands(hero: list[int], opponents: list[list[int]], board: list[int]) -> list[list[int]]:
+    """Each player's hole cards plus the known board, hero first."""
+    return [hero + board] + [opp + board for opp in opponents]
+
+
+def _pot_share(hands: list[list[int]], runout: list[int]) -> float:
+    """
+    Hero's share of the pot once runout completes the board.
+
+    hands come from _player_hands(), so only the drawn cards are appended per
+    runout. Returns 1.0 for a win, 0.0 for a loss and 1/n for an n-way chop.
+    """
+    scores = [evaluate_hand(hand + runout) for hand in hands]
+    hero_score = scores[0]
+
+    # Compare hero vs best opponent
+    best_opponent = max(scores[1:])
+    if hero_score > best_opponent:
+        return 1.0
+    if hero_score < best_opponent:
+        return 0.0
+    # Tie - hero's score counts once among the players who chop
+    return 1.0 / scores.count(hero_score)
 
 
 def _calculate_multiway_deterministic(
-    hero_pk: list[PKCard],
-    opponents_pk: list[list[PKCard]],
-    board_pk: list[PKCard],
+    hero: list[int],
+    opponents: list[list[int]],
+    board: list[int],
 ) -> float:
     """Calculate equity when all cards are known (river showdown) - multiway."""
     try:
-        # Evaluate hero's hand
-        hero_hand = StandardHighHand.from_game(hero_pk, board_pk)
+        return _pot_share(_player_hands(hero, opponents, board), [])
+    except Exception as e:
+        logger.error(f"Multiway deterministic equity calculation failed: {e}")
+        return 0.5
+
 
-        # Evaluate all opponent hands
-        opponent_hands = [StandardHighHand.from_game(opp, board_pk) for opp in opponents_pk]
+def _remaining_deck(hero: list[int], opponents: list[list[int]], board: list[int]) -> list[int]:
+    """Cards that can still come on the board, i.e. the deck minus every known card."""
+    # Get all known cards (dead cards) as a 52-bit mask, bit n set for card n
+    dead_mask = 0
+    for card in chain(hero, board, *opponents):
+        dead_mask |= 1 << card
 
-        # Find the best opponent hand
-        best_opponent = max(opponent_hands)
+    # Copy the full deck and delete dead cards from the top down, so the
+    # positions of lower cards still match their indices
+    remaining_deck = list(_DECK)
+    while dead_mask:
+        card = dead_mask.bit_length() - 1
+        del remaining_deck[card]
+        dead_mask ^= 1 << card
+    return remaining_deck
 
-        # Compare hero vs best opponent
-        if hero_hand > best_opponent:
-            return 1.0
-        elif hero_hand < best_opponent:
-            return 0.0
-        else:
-            # Tie - count how many players tie for best
-            tie_count = sum(1 for h in opponent_hands if h == hero_hand) + 1
-            return 1.0 / tie_count
+
+def _calculate_multiway_exhaustive(
+    hero: list[int],
+    opponents: list[list[int]],
+    board: list[int],
+) -> float:
+    """Calculate exact equity by running out every possible board - multiway."""
+    try:
+        remaining_deck = _remaining_deck(hero, opponents, board)
+        hands = _player_hands(hero, opponents, board)
+
+        total = 0.0
+        runout_count = 0
+        for runout in combinations(remaining_deck, 5 - len(board)):
+            total += _pot_share(hands, list(runout))
+            runout_count += 1
+
+        return total / runout_count
 
     except Exception as e:
-        logger.error(f"Multiway deterministic equity calculation failed: {e}")
+        logger.error(f"Multiway exhaustive equity calculation failed: {e}")
         return 0.5
 
 
 def _calculate_multiway_monte_carlo(
-    hero_pk: list[PKCard],
-    opponents_pk: list[list[PKCard]],
-    board_pk: list[PKCard],
+    hero: list[int],
+    opponents: list[list[int]],
+    board: list[int],
     sample_count: int = 1000,
+    target_ci: float = MC_TARGET_CI,
 ) -> float:
     """
     Calculate equity using Monte Carlo simulation for incomplete boards - multiway.
 
     This runs out the remaining board cards many times to estimate equity.
+    Runouts are drawn in batches of MC_BATCH_SIZE, stopping early once the 95%
+    confidence half-width is below target_ci, and always after sample_count
+    runouts. The half-width is the Agresti-Coull one, which stays honest when
+    every runout so far went the same way (where the sample variance is 0).
+    Lopsided deals converge in the first batch.
     """
     try:
-        # Get all known cards (dead cards)
-        dead_cards = set(hero_pk + board_pk)
-        for opp in opponents_pk:
-            dead_cards.update(opp)
-
-        # Create deck minus dead cards
-        remaining_deck = [c for c in Deck.STANDARD if c not in dead_cards]
-
-        cards_needed = 5 - len(board_pk)
-        wins = 0
-        ties = 0.0
-
-        for _ in range(sample_count):
-            # Draw remaining board cards
-            runout = random.sample(remaining_deck, cards_needed)
-            full_board = board_pk + runout
-
-            # Evaluate all hands
-            hero_hand = StandardHighHand.from_game(hero_pk, full_board)
-            opponent_hands = [StandardHighHand.from_game(opp, full_board) for opp in opponents_pk]
-
-            # Find best opponent
-            best_opponent = max(opponent_hands)
-
-            if hero_hand > best_opponent:
-                wins += 1
-            elif hero_hand == best_opponent:
-                # Count ties
-                tie_count = sum(1 for h in opponent_hands if h == hero_hand) + 1
-                ties += 1.0 / tie_count
+        remaining_deck = _remaining_deck(hero, opponents, board)
+        deck_size = len(remaining_deck)
+        cards_needed = 5 - len(board)
+        hands = _player_hands(hero, opponents, board)
+        rand = _rng.random
+        total = 0.0
+        samples = 0
+
+        while samples < sample_count:
+            batch = min(MC_BATCH_SIZE, sample_count - samples)
+            for _ in range(batch):
+                # Draw remaining board cards with a partial Fisher-Yates shuffle:
+                # swap a random undrawn card into each of the first cards_needed slots
+                for i in range(cards_needed):
+                    j = i + int(rand() * (deck_size - i))
+                    remaining_deck[i], remaining_deck[j] = remaining_deck[j], remaining_deck[i]
+                total += _pot_share(hands, remaining_deck[:cards_needed])
+            samples += batch
+
+            # Agresti-Coull: add z^2/2 wins and z^2/2 losses before taking the
+            # binomial variance. Pot shares lie in [0, 1], so p(1-p) also bounds
+            # the variance of split pots.
+            adjusted_samples = samples + _Z95_SQUARED
+            adjusted_mean = (total + _Z95_SQUARED / 2) / adjusted_samples
+            variance = adjusted_mean * (1.0 - adjusted_mean)
+            if _Z95 * math.sqrt(variance / adjusted_samples) < target_ci:
+                break
 
         # Equity = wins + tie equity
-        equity = (wins + ties) / sample_count
-        return equity
+        return total / samples
 
     except Exception as e:
         logger.error(f"Multiway Monte Carlo equity calculation failed: {e}")
@@ -164,22 +287,22 @@ def _calculate_multiway_monte_carlo(
 
 # Legacy heads-up functions for backwards compatibility
 def _calculate_deterministic_equity(
-    hero_pk: list[PKCard],
-    villain_pk: list[PKCard],
-    board_pk: list[PKCard],
+    hero: list[int],
+    villain: list[int],
+    board: list[int],
 ) -> float:
     """Calculate equity when all cards are known (river showdown) - heads-up."""
-    return _calculate_multiway_deterministic(hero_pk, [villain_pk], board_pk)
+    return _calculate_multiway_deterministic(hero, [villain], board)
 
 
 def _calculate_monte_carlo_equity(
-    hero_pk: list[PKCard],
-    villain_pk: list[PKCard],
-    board_pk: list[PKCard],
+    hero: list[int],
+    villain: list[int],
+    board: list[int],
     sample_count: int = 1000,
 ) -> float:
     """Calculate equity using Monte Carlo for incomplete boards - heads-up."""
-    return _calculate_multiway_monte_carlo(hero_pk, [villain_pk], board_pk, sample_count)
+    return _calculate_multiway_monte_carlo(hero, [villain], board, sample_count)
 
 
 def calculate_all_in_ev(
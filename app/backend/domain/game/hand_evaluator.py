@@ -0,0 +1,137 @@
+"""
+Fast high-hand evaluator for equity calculations.
+
+Cards are encoded as integers 0-51 (rank_index * 4 + suit_index) and a hand of
+up to seven cards is scored in a single pass using per-suit rank bitmasks, so
+no 5-card subsets or hand objects are built. Scores compare like poker hands:
+a higher score is a better hand and equal scores are a chop.
+"""
+
+from collections.abc import Iterable, Sequence
+
+from backend.domain.game.models import Card
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+
+# Hand categories, stored above the 20 bits of packed kicker ranks
+HIGH_CARD = 0
+PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+
+_CATEGORY_SHIFT = 20
+
+_CARD_INDEX: dict[str, int] = {
+    f"{rank}{suit}": rank_index * 4 + suit_index
+    for rank_index, rank in enumerate(RANKS)
+    for suit_index, suit in enumerate(SUITS)
+}
+
+
+def card_index(card: Card) -> int:
+    """Convert a Card to its 0-51 integer encoding."""
+    try:
+        return _CARD_INDEX[f"{card.rank}{card.suit}"]
+    except KeyError:
+        raise ValueError(f"Invalid card: {card}") from None
+
+
+def card_indices(cards: Iterable[Card]) -> list[int]:
+    """Convert Cards to their 0-51 integer encodings."""
+    return [card_index(card) for card in cards]
+
+
+def _straight_high(rank_mask: int) -> int:
+    """Return the rank index of the highest straight in rank_mask, or -1."""
+    # Shift up one bit and copy the ace into bit 0 so A-2-3-4-5 is a run too
+    mask = (rank_mask << 1) | (rank_mask >> 12)
+    runs = mask & (mask >> 1) & (mask >> 2) & (mask >> 3) & (mask >> 4)
+    if not runs:
+        return -1
+    return runs.bit_length() + 2
+
+
+def _top_ranks(rank_mask: int, count: int) -> int:
+    """Pack the highest count ranks of rank_mask into 4-bit nibbles, highest first."""
+    packed = 0
+    for _ in range(count):
+        packed <<= 4
+        if rank_mask:
+            rank = rank_mask.bit_length() - 1
+            packed |= rank
+            rank_mask ^= 1 << rank
+    return packed
+
+
+def evaluate_hand(cards: Sequence[int]) -> int:
+    """
+    Score the best five-card high hand made from up to seven encoded cards.
+
+    Args:
+        cards: Card indices from card_index() (hole cards plus board)
+
+    Returns:
+        Comparable score - higher beats lower, equal scores split the pot
+    """
+    suit_masks = [0, 0, 0, 0]
+    counts = [0] * 13
+    for card in cards:
+        rank = card >> 2
+        suit_masks[card & 3] |= 1 << rank
+        counts[rank] += 1
+
+    # With seven or fewer cards a flush rules out quads and full houses
+    for suit_mask in suit_masks:
+        if suit_mask.bit_count() >= 5:
+            high = _straight_high(suit_mask)
+            if high >= 0:
+                return (STRAIGHT_FLUSH << _CATEGORY_SHIFT) | high
+            return (FLUSH << _CATEGORY_SHIFT) | _top_ranks(suit_mask, 5)
+
+    rank_mask = suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+
+    quads = -1
+    trips: list[int] = []
+    pairs: list[int] = []
+    for rank in range(12, -1, -1):
+        count = counts[rank]
+        if count == 4:
+            quads = rank
+        elif count == 3:
+            trips.append(rank)
+        elif count == 2:
+            pairs.append(rank)
+
+    if quads >= 0:
+        kicker = _top_ranks(rank_mask ^ (1 << quads), 1)
+        return (FOUR_OF_A_KIND << _CATEGORY_SHIFT) | (quads << 4) | kicker
+
+    if trips and (len(trips) > 1 or pairs):
+        # A second set of trips plays as the pair
+        pair = max(trips[1] if len(trips) > 1 else -1, pairs[0] if pairs else -1)
+        return (FULL_HOUSE << _CATEGORY_SHIFT) | (trips[0] << 4) | pair
+
+    high = _straight_high(rank_mask)
+    if high >= 0:
+        return (STRAIGHT << _CATEGORY_SHIFT) | high
+
+    if trips:
+        kickers = _top_ranks(rank_mask ^ (1 << trips[0]), 2)
+        return (THREE_OF_A_KIND << _CATEGORY_SHIFT) | (trips[0] << 8) | kickers
+
+    if len(pairs) >= 2:
+        high_pair, low_pair = pairs[0], pairs[1]
+        kicker = _top_ranks(rank_mask ^ (1 << high_pair) ^ (1 << low_pair), 1)
+        return (TWO_PAIR << _CATEGORY_SHIFT) | (high_pair << 8) | (low_pair << 4) | kicker
+
+    if pairs:
+        kickers = _top_ranks(rank_mask ^ (1 << pairs[0]), 3)
+        return (PAIR << _CATEGORY_SHIFT) | (pairs[0] << 12) | kickers
+
+    return (HIGH_CARD << _CATEGORY_SHIFT) | _top_ranks(rank_mask, 5)
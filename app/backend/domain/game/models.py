@@ -27,9 +27,9 @@ class ActionType(str, Enum):
     ALL_IN = "all_in"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Card:
-    """Poker card representation."""
+    """Poker card representation. Immutable, so parsed cards are shared."""
 
     rank: str  # '2'-'9', 'T', 'J', 'Q', 'K', 'A'
     suit: str  # 'h', 'd', 'c', 's'
@@ -40,6 +40,9 @@ class Card:
     @classmethod
     def from_string(cls, s: str) -> "Card":
         """Create a Card from a string like 'Ah' or 'Tc'."""
+        card = _CARD_CACHE.get(s)
+        if card is not None:
+            return card
         if len(s) != 2:
             raise ValueError(f"Invalid card string: {s}")
         return cls(rank=s[0], suit=s[1])
@@ -52,6 +55,12 @@ class Card:
         return cls(rank=data["rank"], suit=data["suit"])
 
 
+# One shared instance per standard card, returned by Card.from_string
+_CARD_CACHE: dict[str, Card] = {
+    f"{rank}{suit}": Card(rank=rank, suit=suit) for rank in "23456789TJQKA" for suit in "cdhs"
+}
+
+
 @dataclass
 class Action:
     """A poker action with optional sizing."""
@@ -191,6 +200,15 @@ class StructuredGameState:
         """Get active opponents."""
         return [p for p in self.players if p.seat != self.hero_seat and p.is_active]
 
+    @property
+    def preflop_raise_count(self) -> int:
+        """Count preflop raises, bets and all-ins in action_history (for 3-bet detection)."""
+        return sum(
+            1
+            for a in self.action_history
+            if a.get("street") == "preflop" and a.get("action") in ("raise", "bet", "all_in")
+        )
+
     @property
     def pot_odds(self) -> float:
         """Calculate pot odds as a ratio."""
@@ -224,7 +242,7 @@ class HandResult:
     actions_by_street: dict[Street, list[dict[str, Any]]]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EVRecord:
     """
     EV (Expected Value) calculation for a showdown hand.
@@ -253,22 +271,17 @@ class EVRecord:
     ev_chips: float  # (equity × pot) - invested
     actual_chips: float  # What actually happened (+pot if won, -invested if lost)
 
-    @property
-    def variance(self) -> float:
-        """
-        Difference between actual and expected result (the luck component).
-        Positive = ran above EV (lucky), Negative = ran below EV (unlucky)
-        """
-        return self.actual_chips - self.ev_chips
-
-    @property
-    def ev_adjusted(self) -> float:
-        """
-        EV-adjusted result for this showdown (luck removed).
-        For a single showdown, this equals ev_chips.
-        At tournament level: ev_adjusted_total = actual_total - sum(variance)
-        """
-        return self.ev_chips
+    # Derived once in __post_init__ since records are immutable.
+    # variance: actual - EV (the luck component). Positive = ran above EV (lucky),
+    # negative = ran below EV (unlucky).
+    variance: float = field(init=False, repr=False, compare=False)
+    # ev_adjusted: result with luck removed. For a single showdown this equals
+    # ev_chips; at tournament level ev_adjusted_total = actual_total - sum(variance).
+    ev_adjusted: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "variance", self.actual_chips - self.ev_chips)
+        object.__setattr__(self, "ev_adjusted", self.ev_chips)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -9,15 +9,41 @@ reducing file size by ~85% compared to storing full game state.
 """
 
 import json
+import os
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
+from sys import intern
 from typing import Any
 
 from backend.domain.game.models import Action, ActionType, EVRecord, Street, StructuredGameState
 
+try:
+    # Optional faster encoder/parser for saved tournaments (the "orjson" extra)
+    from orjson import OPT_INDENT_2
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _json_loads
 
-@dataclass
+    def _json_dumps(obj: Any) -> bytes:
+        return _orjson_dumps(obj, option=OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+# Enum members by their recorded string value; a dict lookup is much cheaper
+# than calling the Enum for every action replayed
+_ACTION_TYPES: dict[str, ActionType] = {t.value: t for t in ActionType}
+_STREETS: dict[str, Street] = {s.value: s for s in Street}
+
+
+@dataclass(slots=True)
 class MinimalAction:
     """Minimal action record containing only data needed for statistics."""
 
@@ -53,15 +79,37 @@ class MinimalAction:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any], hand_number: int | None = None) -> "MinimalAction":
+        if hand_number is None:
+            hand_number = data.get("hand_number", 0)
+        return cls._from_dict(data, hand_number)
+
+    @classmethod
+    def list_from_dicts(
+        cls, items: list[dict[str, Any]], hand_number: int
+    ) -> list["MinimalAction"]:
+        """Build all of one hand's actions from their dicts."""
+        from_dict = cls._from_dict
+        return [from_dict(data, hand_number) for data in items]
+
+    @classmethod
+    def _from_dict(cls, data: dict[str, Any], hand_number: int) -> "MinimalAction":
+        """
+        Build one action from its dict.
+
+        The required fields are passed positionally, in declaration order
+        (pinned by a test), since keyword matching was most of the
+        per-action cost when loading tournaments.
+        """
         return cls(
-            hand_number=hand_number if hand_number is not None else data.get("hand_number", 0),
-            street=data["street"],
-            actor=data["actor"],
-            action_type=data["action_type"],
-            amount=data.get("amount"),
-            pot=data["pot"],
-            current_bet=data["current_bet"],
-            preflop_raise_count=data["preflop_raise_count"],
+            hand_number,
+            # json gives every value its own string, so share the repeated ones
+            intern(data["street"]),
+            intern(data["actor"]),
+            intern(data["action_type"]),
+            data.get("amount"),
+            data["pot"],
+            data["current_bet"],
+            data["preflop_raise_count"],
             stacks=data.get("stacks", {}),
             decision_type=data.get("decision", "gto"),
             deviation_reason=data.get("deviation_reason"),
@@ -98,7 +146,7 @@ class MinimalAction:
     def to_action(self) -> Action:
         """Convert back to Action object."""
         return Action(
-            type=ActionType(self.action_type),
+            type=_ACTION_TYPES[self.action_type],
             amount=self.amount,
         )
 
@@ -106,7 +154,7 @@ class MinimalAction:
         """Create a minimal stub game state for statistics tracking."""
         return StubGameState(
             hand_number=self.hand_number,
-            street=Street(self.street),
+            street=_STREETS[self.street],
             pot=self.pot,
             current_bet=self.current_bet,
             big_blind=big_blind,
@@ -114,6 +162,10 @@ class MinimalAction:
         )
 
 
+# Read-only entry repeated by StubGameState.action_history
+_PREFLOP_RAISE: dict[str, str] = {"street": "preflop", "action": "raise"}
+
+
 @dataclass
 class StubGameState:
     """Minimal game state stub for statistics recalculation."""
@@ -127,11 +179,11 @@ class StubGameState:
 
     @property
     def action_history(self) -> list[dict]:
-        """Return synthetic action history for 3-bet detection."""
-        return [{"street": "preflop", "action": "raise"} for _ in range(self.preflop_raise_count)]
+        """Return a synthetic action history matching preflop_raise_count."""
+        return [_PREFLOP_RAISE] * self.preflop_raise_count
 
 
-@dataclass
+@dataclass(slots=True)
 class HandRecord:
     """Record of a single hand's actions."""
 
@@ -165,30 +217,24 @@ class HandRecord:
 
     def to_summary_dict(self) -> dict[str, Any]:
         """Generate a summary of the hand for the hand_summaries section."""
-        # Calculate chips won/lost per player
-        chips_won: dict[str, float] = {}
-        for player in self.starting_stacks:
-            start = self.starting_stacks.get(player, 0)
-            finish = self.finishing_stacks.get(player, start)
-            chips_won[player] = round(finish - start, 2)
-
-        # Determine winners (players who gained chips)
-        winners = [player for player, change in chips_won.items() if change > 0]
-
         # Check if hand went to showdown (has EV records)
         went_to_showdown = len(self.ev_records) > 0
+        ev_by_player = {ev.player_id: ev.ev_adjusted for ev in self.ev_records}
 
-        # Calculate EV-adjusted chips per player if showdown
-        ev_adjusted_chips: dict[str, float] | None = None
-        if went_to_showdown:
-            ev_adjusted_chips = {}
-            ev_by_player = {ev.player_id: ev.ev_adjusted for ev in self.ev_records}
-            for player in self.starting_stacks:
-                if player in ev_by_player:
-                    ev_adjusted_chips[player] = round(ev_by_player[player], 2)
-                else:
-                    # Non-showdown players: use actual chips won
-                    ev_adjusted_chips[player] = chips_won.get(player, 0)
+        # One pass over the players: chips won/lost, winners (players who gained
+        # chips) and, at showdown, EV-adjusted chips
+        chips_won: dict[str, float] = {}
+        winners: list[str] = []
+        ev_adjusted_chips: dict[str, float] | None = {} if went_to_showdown else None
+        for player, start in self.starting_stacks.items():
+            change = round(self.finishing_stacks.get(player, start) - start, 2)
+            chips_won[player] = change
+            if change > 0:
+                winners.append(player)
+            if ev_adjusted_chips is not None:
+                # Non-showdown players: use actual chips won
+                ev = ev_by_player.get(player)
+                ev_adjusted_chips[player] = round(ev, 2) if ev is not None else change
 
         return {
             "hand_number": self.hand_number,
@@ -205,17 +251,22 @@ class HandRecord:
             hand_number=hand_number,
             small_blind=data.get("small_blind", 10.0),
             big_blind=data.get("big_blind", 20.0),
-            actions=[
-                MinimalAction.from_dict(a, hand_number=hand_number) for a in data.get("actions", [])
-            ],
+            actions=MinimalAction.list_from_dicts(data.get("actions", []), hand_number),
             starting_stacks=data.get("starting_stacks", {}),
             finishing_stacks=data.get("finishing_stacks", {}),
             ev_records=[EVRecord.from_dict(ev) for ev in data.get("ev_records", [])],
-            community_cards=data.get("community_cards", []),
-            shown_hands=data.get("shown_hands", {}),
+            # Only 52 distinct card strings exist, so share them across hands
+            community_cards=list(map(intern, data.get("community_cards", []))),
+            shown_hands={
+                player: list(map(intern, cards))
+                for player, cards in data.get("shown_hands", {}).items()
+            },
         )
 
 
+_hand_actions = attrgetter("actions")
+
+
 @dataclass
 class TournamentRecord:
     """Complete record of a tournament's actions for statistics and EV tracking."""
@@ -228,7 +279,7 @@ class TournamentRecord:
     @property
     def actions(self) -> list[MinimalAction]:
         """Flatten all actions from all hands (for backward compatibility)."""
-        return [action for hand in self.hands for action in hand.actions]
+        return list(chain.from_iterable(map(_hand_actions, self.hands)))
 
     @property
     def big_blind(self) -> float:
@@ -361,9 +412,7 @@ def _group_actions_by_hand(
 
     hands_dict: dict[int, list[MinimalAction]] = {}
     for action in actions:
-        if action.hand_number not in hands_dict:
-            hands_dict[action.hand_number] = []
-        hands_dict[action.hand_number].append(action)
+        hands_dict.setdefault(action.hand_number, []).append(action)
 
     return [
         HandRecord(
@@ -577,8 +626,12 @@ class GameStateRecorder:
         )
         filepath = self._gamestates_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(self._current_tournament.to_dict(), f, indent=2)
+        # Encode into one buffer and write it once, to a temp file renamed into
+        # place so load_all_tournaments never sees a half-written record
+        payload = _json_dumps(self._current_tournament.to_dict())
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(filepath)
 
         self._current_tournament = None
         self._current_hand = None
@@ -598,25 +651,46 @@ class GameStateRecorder:
     @classmethod
     def load_tournament(cls, filepath: str) -> TournamentRecord:
         """Load a tournament record from a JSON file (supports v1, v2, and v3 formats)."""
-        with open(filepath, "r") as f:
-            data = json.load(f)
+        data = _json_loads(Path(filepath).read_bytes())
         return TournamentRecord.from_dict(data)
 
-    @classmethod
-    def load_all_tournaments(
-        cls, gamestates_dir: str = "data/gamestates"
-    ) -> list[TournamentRecord]:
-        """Load all tournament records from the gamestates directory."""
-        path = Path(gamestates_dir)
-        if not path.exists():
+    @staticmethod
+    def tournament_files(gamestates_dir: str = "data/gamestates") -> list[os.DirEntry[str]]:
+        """
+        List the saved tournament files in the gamestates directory, sorted by name.
+
+        Uses os.scandir with plain prefix/suffix checks instead of glob, so no
+        pattern is compiled and no per-file stat() is needed to skip directories.
+        """
+        try:
+            with os.scandir(gamestates_dir) as entries:
+                files = [
+                    entry
+                    for entry in entries
+                    if entry.name.startswith("tournament_")
+                    and entry.name.endswith(".json")
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
             return []
+        files.sort(key=attrgetter("name"))
+        return files
 
-        tournaments = []
-        for filepath in sorted(path.glob("tournament_*.json")):
+    @classmethod
+    def iter_tournaments(
+        cls, gamestates_dir: str = "data/gamestates"
+    ) -> Iterator[TournamentRecord]:
+        """Yield tournament records from the gamestates directory one file at a time."""
+        for entry in cls.tournament_files(gamestates_dir):
             try:
-                tournaments.append(cls.load_tournament(str(filepath)))
+                yield cls.load_tournament(entry.path)
             except (json.JSONDecodeError, KeyError) as e:
-                print(f"Warning: Could not load {filepath}: {e}")
+                print(f"Warning: Could not load {entry.path}: {e}")
                 continue
 
-        return tournaments
+    @classmethod
+    def load_all_tournaments(
+        cls, gamestates_dir: str = "data/gamestates"
+    ) -> list[TournamentRecord]:
+        """Load all tournament records from the gamestates directory."""
+        return list(cls.iter_tournaments(gamestates_dir))
@@ -6,14 +6,15 @@ the Exploit Scout agent to identify tendencies and leaks.
 """
 
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 # Minimum hands required for statistics to be considered reliable for exploitation
 MIN_RELIABLE_SAMPLE_SIZE = 50
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStatistics:
     """
     Core poker statistics tracked for each player.
@@ -128,8 +129,13 @@ class PlayerStatistics:
         elif self._river_bets_and_raises > 0:
             self.river_aggression = 10.0  # Cap at 10
 
-    def accumulate(self, other: "PlayerStatistics") -> None:
-        """Add raw counters from another stats object (for calibration accumulation)."""
+    def accumulate(self, other: "PlayerStatistics", recalculate: bool = True) -> None:
+        """
+        Add raw counters from another stats object (for calibration accumulation).
+
+        Pass recalculate=False when merging many objects in a row and call
+        recalculate() once at the end.
+        """
         self.hands_played += other.hands_played
         self._vpip_hands += other._vpip_hands
         self._pfr_hands += other._pfr_hands
@@ -155,8 +161,17 @@ class PlayerStatistics:
         self._raise_sizing_count += other._raise_sizing_count
         self._river_bets_and_raises += other._river_bets_and_raises
         self._river_calls += other._river_calls
+        self.ev_adjusted_total += other.ev_adjusted_total
+        self.showdown_count += other.showdown_count
         # Recalculate percentages from accumulated totals
-        self.recalculate()
+        if recalculate:
+            self.recalculate()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization (same keys as asdict)."""
+        # Every field is a scalar, so read the slots directly instead of letting
+        # asdict recurse and deep-copy each value
+        return {name: getattr(self, name) for name in self.__slots__}
 
     @property
     def is_reliable(self) -> bool:
@@ -286,7 +301,7 @@ class KnowledgeBase:
                 player_id: {
                     "player_id": profile.player_id,
                     "name": profile.name,
-                    "statistics": asdict(profile.statistics),
+                    "statistics": profile.statistics.to_dict(),
                     "tendencies": profile.tendencies,
                 }
                 for player_id, profile in self.profiles.items()
@@ -7,17 +7,21 @@ the StatisticsTracker to compute fresh baseline statistics.
 Supports both old (v1) and new minimal (v2) tournament formats.
 """
 
+import json
 from pathlib import Path
 from typing import Any
 
 from backend.domain.game.models import HandResult, Street
 from backend.domain.game.recorder import GameStateRecorder, TournamentRecord
-from backend.domain.player.models import KnowledgeBase
+from backend.domain.player.models import KnowledgeBase, PlayerStatistics
 from backend.domain.player.tracker import StatisticsTracker
 from backend.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Bump when replay logic changes so cached per-tournament counters are rebuilt
+_CACHE_VERSION = 1
+
 
 def recalculate_baseline_stats(
     gamestates_dir: str = "data/gamestates",
@@ -31,6 +35,11 @@ def recalculate_baseline_stats(
     2. Replays all recorded actions through a fresh StatisticsTracker
     3. Saves the resulting statistics to stats.json
 
+    Each tournament is replayed on its own and its per-player counters are
+    kept in a sidecar cache next to output_path, keyed by file name, mtime
+    and size. Later runs only replay tournaments that are new or changed and
+    add the cached counters for the rest.
+
     Args:
         gamestates_dir: Directory containing tournament JSON files
         output_path: Path to save the recalculated statistics
@@ -38,29 +47,52 @@ def recalculate_baseline_stats(
     Returns:
         The recalculated KnowledgeBase
     """
-    tournaments = GameStateRecorder.load_all_tournaments(gamestates_dir)
-
-    if not tournaments:
-        logger.info("No saved tournaments found, starting with empty baseline stats")
-        return KnowledgeBase()
-
-    logger.info(f"📊 Recalculating stats from {len(tournaments)} saved tournaments")
+    cache_path = Path(output_path).with_suffix(".cache.json")
+    cache = _load_cache(cache_path)
+    fresh_cache: dict[str, dict[str, Any]] = {}
 
     knowledge_base = KnowledgeBase()
-    tracker = StatisticsTracker(knowledge_base)
-
     total_hands = 0
     total_actions = 0
+    replayed = 0
+
+    for entry in GameStateRecorder.tournament_files(gamestates_dir):
+        stat = entry.stat()
+        cached = cache.get(entry.name)
+        if (
+            cached is None
+            or cached["mtime_ns"] != stat.st_mtime_ns
+            or cached["size"] != stat.st_size
+        ):
+            try:
+                tournament = GameStateRecorder.load_tournament(entry.path)
+            except (json.JSONDecodeError, KeyError) as e:
+                logger.warning("Could not load %s: %s", entry.path, e)
+                continue
+            cached = _replay_into_cache_entry(tournament, stat.st_mtime_ns, stat.st_size)
+            replayed += 1
+
+        fresh_cache[entry.name] = cached
+        total_hands += cached["hands"]
+        total_actions += cached["actions"]
+        for player_id, statistics in cached["profiles"].items():
+            profile = knowledge_base.get_or_create_profile(player_id, player_id)
+            profile.statistics.accumulate(PlayerStatistics(**statistics), recalculate=False)
+
+    if not fresh_cache:
+        logger.info("No saved tournaments found, starting with empty baseline stats")
+        return KnowledgeBase()
 
-    for tournament in tournaments:
-        hands_in_tournament = _replay_tournament(tournament, tracker)
-        total_hands += hands_in_tournament
-        total_actions += len(tournament.actions)
-
-    logger.info(f"📊 Recalculated stats from {total_actions} actions across {total_hands} hands")
+    logger.info(
+        f"📊 Recalculated stats from {total_actions} actions across {total_hands} hands "
+        f"in {len(fresh_cache)} saved tournaments ({replayed} replayed, "
+        f"{len(fresh_cache) - replayed} cached)"
+    )
 
     for player_id, profile in knowledge_base.profiles.items():
         stats = profile.statistics
+        # Counters were merged without recalculating, so derive percentages once here
+        stats.recalculate()
         ev_info = f", EV-adj: {stats.ev_adjusted_total:+.0f}" if stats.showdown_count > 0 else ""
         logger.info(
             f"  {player_id}: {stats.hands_played} hands, "
@@ -72,9 +104,74 @@ def recalculate_baseline_stats(
     knowledge_base.save_to_file(output_path)
     logger.info(f"📊 Saved recalculated stats to {output_path}")
 
+    if replayed or fresh_cache.keys() != cache.keys():
+        cache_path.write_text(json.dumps({"version": _CACHE_VERSION, "tournaments": fresh_cache}))
+
     return knowledge_base
 
 
+def is_stats_file_fresh(
+    gamestates_dir: str = "data/gamestates",
+    stats_path: str = "data/knowledge/stats.json",
+) -> bool:
+    """
+    Check whether stats_path already reflects every saved tournament.
+
+    The stats file is fresh when it is newer than every tournament JSON file
+    and than the gamestates directory itself (whose mtime changes when files
+    are added or removed), so recalculation would reproduce it unchanged.
+
+    Args:
+        gamestates_dir: Directory containing tournament JSON files
+        stats_path: Path to the previously recalculated statistics
+
+    Returns:
+        True if stats_path can be loaded instead of recalculating
+    """
+    stats_file = Path(stats_path)
+    gamestates = Path(gamestates_dir)
+    if not stats_file.exists() or not gamestates.exists():
+        return False
+
+    tournament_mtimes = [
+        entry.stat().st_mtime for entry in GameStateRecorder.tournament_files(gamestates_dir)
+    ]
+    if not tournament_mtimes:
+        return False
+
+    newest_input = max(gamestates.stat().st_mtime, *tournament_mtimes)
+    return stats_file.stat().st_mtime > newest_input
+
+
+def _load_cache(cache_path: Path) -> dict[str, dict[str, Any]]:
+    """Load the per-tournament counter cache, or return an empty one if unusable."""
+    try:
+        data = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    return data.get("tournaments", {})
+
+
+def _replay_into_cache_entry(
+    tournament: TournamentRecord, mtime_ns: int, size: int
+) -> dict[str, Any]:
+    """Replay one tournament on a fresh tracker and return its cache entry."""
+    knowledge_base = KnowledgeBase()
+    hands = _replay_tournament(tournament, StatisticsTracker(knowledge_base))
+    return {
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "hands": hands,
+        "actions": sum(len(hand.actions) for hand in tournament.hands),
+        "profiles": {
+            player_id: profile.statistics.to_dict()
+            for player_id, profile in knowledge_base.profiles.items()
+        },
+    }
+
+
 def _replay_tournament(tournament: TournamentRecord, tracker: StatisticsTracker) -> int:
     """
     Replay a single tournament's recorded actions through the tracker.
@@ -92,18 +189,21 @@ def _replay_tournament(tournament: TournamentRecord, tracker: StatisticsTracker)
     players = tournament.players
     hands_replayed = 0
 
+    observe_action = tracker.observe_action
+
     for hand in tournament.hands:
         tracker.start_hand(players)
+        big_blind = hand.big_blind
 
         for minimal_action in hand.actions:
-            action = minimal_action.to_action()
-            stub_state = minimal_action.to_stub_game_state(hand.big_blind)
+            stub_state = minimal_action.to_stub_game_state(big_blind)
 
-            tracker.observe_action(
+            observe_action(
                 player_id=minimal_action.actor,
                 player_name=minimal_action.actor,
-                action=action,
+                action=minimal_action.to_action(),
                 game_state=stub_state,  # type: ignore - duck typing works here
+                recalculate=False,  # _end_hand recalculates every player once per hand
             )
 
         _end_hand(tracker, players, hand.hand_number)
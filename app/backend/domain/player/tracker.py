@@ -10,6 +10,11 @@ from backend.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Action groupings checked on every observed action
+# (tuples, not sets: membership is an identity check, while Enum hashing runs in Python)
+_AGGRESSIVE_ACTIONS = (ActionType.BET, ActionType.RAISE, ActionType.ALL_IN)
+_VOLUNTARY_ACTIONS = (ActionType.CALL, *_AGGRESSIVE_ACTIONS)
+
 
 class StatisticsTracker:
     """
@@ -64,6 +69,7 @@ class StatisticsTracker:
         player_name: str,
         action: Action,
         game_state: StructuredGameState,
+        recalculate: bool = True,
     ) -> None:
         """
         Observe a player's action and update tracking.
@@ -73,6 +79,8 @@ class StatisticsTracker:
             player_name: Name of the acting player
             action: The action taken
             game_state: Current game state
+            recalculate: Refresh the player's percentages now. Replays can pass
+                False and rely on end_hand, which recalculates every player.
         """
         # Ensure profile exists
         profile = self.knowledge_base.get_or_create_profile(player_id, player_name)
@@ -107,7 +115,7 @@ class StatisticsTracker:
             hand_state["calls"] += 1
             stats._calls += 1
 
-        elif action.type in (ActionType.BET, ActionType.RAISE, ActionType.ALL_IN):
+        elif action.type in _AGGRESSIVE_ACTIONS:
             hand_state["bets"] += 1
             stats._bets_and_raises += 1
 
@@ -137,7 +145,8 @@ class StatisticsTracker:
             self._track_river(player_id, action, game_state, hand_state, stats)
 
         # Recalculate percentages
-        stats.recalculate()
+        if recalculate:
+            stats.recalculate()
 
     def _track_preflop(
         self,
@@ -149,13 +158,13 @@ class StatisticsTracker:
     ) -> None:
         """Track preflop action."""
         # VPIP - any voluntary money in pot
-        if action.type in (ActionType.CALL, ActionType.BET, ActionType.RAISE, ActionType.ALL_IN):
+        if action.type in _VOLUNTARY_ACTIONS:
             if not hand_state["vpip"]:
                 hand_state["vpip"] = True
                 stats._vpip_hands += 1
 
         # PFR - preflop raise
-        if action.type in (ActionType.RAISE, ActionType.BET, ActionType.ALL_IN):
+        if action.type in _AGGRESSIVE_ACTIONS:
             if not hand_state["pfr"]:
                 hand_state["pfr"] = True
                 stats._pfr_hands += 1
@@ -170,19 +179,15 @@ class StatisticsTracker:
                     stats._limp_hands += 1
 
         # 3-bet / fold-to-3bet tracking
-        preflop_raises = [
-            a
-            for a in game_state.action_history
-            if a.get("street") == "preflop" and a.get("action") in ("raise", "bet", "all_in")
-        ]
-        num_raises = len(preflop_raises)
+        # Recorded replays carry the count directly, so no history is scanned
+        num_raises = game_state.preflop_raise_count
 
         # 3-bet opportunity: facing exactly 1 raise (the open), you can 3-bet
         if num_raises == 1 and not hand_state["three_bet_opportunity"]:
             hand_state["three_bet_opportunity"] = True
             stats._three_bet_opportunities += 1
 
-            if action.type in (ActionType.RAISE, ActionType.BET, ActionType.ALL_IN):
+            if action.type in _AGGRESSIVE_ACTIONS:
                 hand_state["three_bet"] = True
                 stats._three_bet_count += 1
 
@@ -217,7 +222,7 @@ class StatisticsTracker:
                 hand_state["cbet_flop_opportunity"] = True
                 stats._cbet_flop_opportunities += 1
 
-                if action.type in (ActionType.BET, ActionType.RAISE, ActionType.ALL_IN):
+                if action.type in _AGGRESSIVE_ACTIONS:
                     hand_state["cbet_flop"] = True
                     stats._cbet_flop_count += 1
 
@@ -236,7 +241,7 @@ class StatisticsTracker:
                 hand_state["cbet_turn_opportunity"] = True
                 stats._cbet_turn_opportunities += 1
 
-                if action.type in (ActionType.BET, ActionType.RAISE, ActionType.ALL_IN):
+                if action.type in _AGGRESSIVE_ACTIONS:
                     hand_state["cbet_turn"] = True
                     stats._cbet_turn_count += 1
 
@@ -255,12 +260,12 @@ class StatisticsTracker:
                 hand_state["cbet_river_opportunity"] = True
                 stats._cbet_river_opportunities += 1
 
-                if action.type in (ActionType.BET, ActionType.RAISE, ActionType.ALL_IN):
+                if action.type in _AGGRESSIVE_ACTIONS:
                     hand_state["cbet_river"] = True
                     stats._cbet_river_count += 1
 
         # River aggression (per action, same style as overall aggression)
-        if action.type in (ActionType.BET, ActionType.RAISE, ActionType.ALL_IN):
+        if action.type in _AGGRESSIVE_ACTIONS:
             stats._river_bets_and_raises += 1
         elif action.type == ActionType.CALL:
             stats._river_calls += 1
@@ -5,7 +5,10 @@ Provides cross-process file locking to prevent race conditions when
 multiple tournament processes read/write shared files like stats.json.
 """
 
+import atexit
 import fcntl
+import os
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
@@ -14,10 +17,57 @@ from backend.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Idle lock file descriptors kept open between locks, keyed by lock path, with
+# the inode they were opened on. Every holder takes its own descriptor, so
+# flock treats locks from different threads (or nested locks) exactly as if
+# each had opened the file itself; the guard only protects the pool.
+_idle_fds: dict[str, list[tuple[int, int]]] = {}
+_idle_fds_guard = threading.Lock()
+
+
+def _acquire_fd(lock_path: str) -> tuple[int, int]:
+    """
+    Take an open descriptor for lock_path from the idle pool, or open one.
+
+    Pooled descriptors are dropped if the lock file was deleted or replaced
+    since they were opened, so every process keeps locking the same file.
+    """
+    with _idle_fds_guard:
+        idle = _idle_fds.get(lock_path)
+        while idle:
+            fd, inode = idle.pop()
+            try:
+                if os.stat(lock_path).st_ino == inode:
+                    return fd, inode
+            except FileNotFoundError:
+                pass
+            os.close(fd)
+
+    # Ensure parent directory exists
+    Path(lock_path).parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o644)
+    return fd, os.fstat(fd).st_ino
+
+
+def _release_fd(lock_path: str, entry: tuple[int, int]) -> None:
+    """Return an unlocked descriptor to the idle pool for reuse."""
+    with _idle_fds_guard:
+        _idle_fds.setdefault(lock_path, []).append(entry)
+
+
+@atexit.register
+def _close_lock_fds() -> None:
+    """Close every idle lock file descriptor."""
+    with _idle_fds_guard:
+        for idle in _idle_fds.values():
+            for fd, _ in idle:
+                os.close(fd)
+        _idle_fds.clear()
+
 
 @contextmanager
 def file_lock(
-    file_path: str,
+    file_path: str | Path,
     exclusive: bool = True,
     timeout: float | None = None,
 ) -> Generator[None, None, None]:
@@ -42,34 +92,33 @@ def file_lock(
         - Locks are advisory - all processes must use this utility
         - Lock is released automatically when context exits
         - Works across processes, not just threads
+        - The lock file stays open between locks, so repeated locks on the
+          same path skip the open/close
     """
     lock_path = str(file_path) + ".lock"
 
-    # Ensure parent directory exists
-    Path(lock_path).parent.mkdir(parents=True, exist_ok=True)
-
     lock_type = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
     lock_name = "exclusive" if exclusive else "shared"
 
-    # Open lock file (create if doesn't exist)
-    lock_file = open(lock_path, "w")
-
+    # Reuse an idle lock file descriptor from earlier locks on this path
+    entry = _acquire_fd(lock_path)
+    fd = entry[0]
     try:
-        logger.debug(f"Acquiring {lock_name} lock on {file_path}")
-        fcntl.flock(lock_file.fileno(), lock_type)
-        logger.debug(f"Acquired {lock_name} lock on {file_path}")
+        logger.debug("Acquiring %s lock on %s", lock_name, file_path)
+        fcntl.flock(fd, lock_type)
+        logger.debug("Acquired %s lock on %s", lock_name, file_path)
 
         yield
 
     finally:
-        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-        lock_file.close()
-        logger.debug(f"Released {lock_name} lock on {file_path}")
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        _release_fd(lock_path, entry)
+        logger.debug("Released %s lock on %s", lock_name, file_path)
 
 
 @contextmanager
 def stats_file_lock(
-    stats_path: str,
+    stats_path: str | Path,
     exclusive: bool = True,
 ) -> Generator[None, None, None]:
     """
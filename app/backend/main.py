@@ -10,16 +10,20 @@ Usage:
 
 import argparse
 import asyncio
+import importlib.util
 import json
 import os
 import signal
-from collections import Counter
+import sys
 from datetime import datetime
 from pathlib import Path
+from statistics import fmean
+from weakref import WeakSet
 
 from backend.config import Settings
 from backend.domain.agent.utils import deviation_tracker
-from backend.domain.player.recalculator import recalculate_baseline_stats
+from backend.domain.player.models import KnowledgeBase
+from backend.domain.player.recalculator import is_stats_file_fresh, recalculate_baseline_stats
 from backend.domain.tournament.orchestrator import (
     TournamentConfig,
     TournamentOrchestrator,
@@ -29,9 +33,13 @@ from backend.logging_config import get_logger, log_collector, setup_logging
 
 logger = get_logger(__name__)
 
+# Separator line framing each tournament's log header
+_BANNER = "=" * 60
+
 # Global state for graceful shutdown
 _shutdown_requested = False
-_current_orchestrator: TournamentOrchestrator | None = None
+# Every running orchestrator, so SIGINT can save all concurrent tournaments
+_active_orchestrators: WeakSet[TournamentOrchestrator] = WeakSet()
 
 
 def _handle_sigint(signum, frame):
@@ -44,8 +52,8 @@ def _handle_sigint(signum, frame):
     _shutdown_requested = True
     print("\n⚠️ Shutdown requested - saving current tournament state...")
 
-    if _current_orchestrator is not None:
-        _current_orchestrator.save_incomplete()
+    for orchestrator in list(_active_orchestrators):
+        orchestrator.save_incomplete()
 
     raise KeyboardInterrupt
 
@@ -55,27 +63,29 @@ async def run_single_tournament(
     config: TournamentConfig,
 ) -> TournamentResult:
     """Run a single tournament and return results."""
-    global _current_orchestrator
-
     # Recalculate stats from ALL saved tournaments before each tournament
-    # This ensures each tournament benefits from previous tournaments' data
+    # This ensures each tournament benefits from previous tournaments' data.
+    # Skip the replay when stats.json is already newer than every saved tournament.
     stats_path = f"{settings.knowledge_persistence_dir}/stats.json"
-    baseline_kb = recalculate_baseline_stats(
-        gamestates_dir=settings.gamestates_dir,
-        output_path=stats_path,
-    )
+    if is_stats_file_fresh(settings.gamestates_dir, stats_path):
+        baseline_kb = KnowledgeBase.load_from_file(stats_path)
+    else:
+        baseline_kb = recalculate_baseline_stats(
+            gamestates_dir=settings.gamestates_dir,
+            output_path=stats_path,
+        )
     if baseline_kb.profiles:
         total_hands = baseline_kb.get_total_hands_observed()
         logger.info(f"📊 Stats loaded: {total_hands} total hands from saved tournaments")
 
     orchestrator = TournamentOrchestrator(settings)
-    _current_orchestrator = orchestrator
+    _active_orchestrators.add(orchestrator)
 
-    orchestrator.setup_tournament(config=config)
     try:
+        orchestrator.setup_tournament(config=config)
         return await orchestrator.run_tournament()
     finally:
-        _current_orchestrator = None
+        _active_orchestrators.discard(orchestrator)
 
 
 async def run_experiment(
@@ -106,7 +116,8 @@ async def run_experiment(
         "agent_e_wins": 0,
         "agent_d_placements": [],
         "agent_e_placements": [],
-        "all_placements": Counter(),
+        # player_id -> finish counts indexed by placement - 1
+        "all_placements": {},
         "tournament_results": [],
         # EV tracking aggregates
         "ev_by_player": {},  # Accumulated EV across all tournaments
@@ -117,9 +128,7 @@ async def run_experiment(
     config = TournamentConfig()
 
     for i in range(num_tournaments):
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"TOURNAMENT {i + 1}/{num_tournaments}")
-        logger.info(f"{'=' * 60}\n")
+        logger.info("\n%s\nTOURNAMENT %d/%d\n%s\n", _BANNER, i + 1, num_tournaments, _BANNER)
 
         try:
             result = await run_single_tournament(settings, config)
@@ -137,8 +146,12 @@ async def run_experiment(
                 results["agent_e_wins"] += 1
 
             # Track all placements
+            all_placements = results["all_placements"]
             for idx, player_id in enumerate(result.placements):
-                results["all_placements"][(player_id, idx + 1)] += 1
+                tally = all_placements.get(player_id)
+                if tally is None:
+                    tally = all_placements[player_id] = [0] * len(result.placements)
+                tally[idx] += 1
 
             # Aggregate EV data
             for player_id, ev_data in result.ev_by_player.items():
@@ -170,19 +183,9 @@ async def run_experiment(
             continue
 
     # Calculate statistics
-    if results["agent_d_placements"]:
-        results["agent_d_avg_placement"] = sum(results["agent_d_placements"]) / len(
-            results["agent_d_placements"]
-        )
-    else:
-        results["agent_d_avg_placement"] = 0
-
-    if results["agent_e_placements"]:
-        results["agent_e_avg_placement"] = sum(results["agent_e_placements"]) / len(
-            results["agent_e_placements"]
-        )
-    else:
-        results["agent_e_avg_placement"] = 0
+    for agent_id in ("agent_d", "agent_e"):
+        placements = results[f"{agent_id}_placements"]
+        results[f"{agent_id}_avg_placement"] = fmean(placements) if placements else 0
 
     if results["tournaments_run"] > 0:
         results["agent_d_win_rate"] = results["agent_d_wins"] / results["tournaments_run"]
@@ -198,14 +201,22 @@ async def run_experiment(
 
 
 def save_experiment_results(
-    results: dict, output_dir: str = "data/results", include_logs: bool = True
+    results: dict,
+    output_dir: str = "data/results",
+    include_logs: bool = True,
+    compact: bool = False,
+    output_format: str = "json",
 ) -> str:
-    """Save experiment results to JSON file with timestamp.
+    """Save experiment results to a JSON (or msgpack) file with timestamp.
 
     Args:
         results: Experiment results dict
         output_dir: Directory to save results
         include_logs: Whether to include game logs in output
+        compact: Omit game logs (and the hole cards they carry) and write
+            unindented JSON
+        output_format: "json", or "msgpack" for a smaller binary file
+            (requires the optional msgpack dependency)
 
     Returns:
         Path to saved results file
@@ -249,10 +260,7 @@ def save_experiment_results(
             "ev_adjusted": agent_e_ev.get("ev_adjusted", 0),
             "showdown_count": agent_e_ev.get("showdown_count", 0),
         },
-        "all_placements": {
-            f"{player}_{place}": count
-            for (player, place), count in results["all_placements"].items()
-        },
+        "all_placements": results["all_placements"],
         "tournament_details": [
             {
                 "tournament_num": i + 1,
@@ -275,48 +283,81 @@ def save_experiment_results(
     }
 
     # Include game logs if requested
-    if include_logs:
+    if include_logs and not compact:
         export_data["game_logs"] = log_collector.get_entries()
 
-    with open(filename, "w") as f:
-        json.dump(export_data, f, indent=2)
+    if output_format == "msgpack":
+        import msgpack
+
+        filename = filename.with_suffix(".msgpack")
+        filename.write_bytes(msgpack.packb(export_data, use_bin_type=True))
+        return str(filename)
+
+    # Encode into one buffer and write it once; json.dump to a file issues a
+    # write() per encoded chunk, which dominates for large tournament_details
+    if compact:
+        payload = json.dumps(export_data, separators=(",", ":"))
+    else:
+        payload = json.dumps(export_data, indent=2)
+    filename.write_text(payload)
 
     return str(filename)
 
 
+def read_experiment_results(filepath: str) -> dict:
+    """Load experiment results saved by save_experiment_results.
+
+    Args:
+        filepath: Path to an experiment_*.json or experiment_*.msgpack file
+
+    Returns:
+        The exported results dict
+    """
+    path = Path(filepath)
+    if path.suffix == ".msgpack":
+        import msgpack
+
+        return msgpack.unpackb(path.read_bytes(), raw=False)
+    return json.loads(path.read_text())
+
+
 def print_results(results: dict) -> None:
     """Print experiment results in a nice format."""
-    print("\n" + "=" * 70)
-    print("🃏 POKER POC EXPERIMENT RESULTS")
-    print("=" * 70)
-    print(f"Tournaments completed: {results['tournaments_run']}")
-    print()
-
-    print("AGENT D (Simple Architecture - Single LLM):")
-    print(f"  - Wins: {results['agent_d_wins']}")
-    print(f"  - Win Rate: {results['agent_d_win_rate']:.1%}")
-    print(f"  - Average Placement: {results['agent_d_avg_placement']:.2f}")
-    print(f"  - Placements: {results['agent_d_placements']}")
-    print()
-
-    print("AGENT E (Ensemble Architecture - GTO + Exploit + Decision):")
-    print(f"  - Wins: {results['agent_e_wins']}")
-    print(f"  - Win Rate: {results['agent_e_win_rate']:.1%}")
-    print(f"  - Average Placement: {results['agent_e_avg_placement']:.2f}")
-    print(f"  - Placements: {results['agent_e_placements']}")
-    print()
-
-    print("ALL AGENT PLACEMENT DISTRIBUTION:")
-    for (player_id, placement), count in sorted(results["all_placements"].items()):
-        print(f"  - {player_id} placed {placement}: {count} times")
-    print()
+    lines: list[str] = []
+    lines.append("\n" + "=" * 70)
+    lines.append("🃏 POKER POC EXPERIMENT RESULTS")
+    lines.append("=" * 70)
+    lines.append(f"Tournaments completed: {results['tournaments_run']}")
+    lines.append("")
+
+    lines.append("AGENT D (Simple Architecture - Single LLM):")
+    lines.append(f"  - Wins: {results['agent_d_wins']}")
+    lines.append(f"  - Win Rate: {results['agent_d_win_rate']:.1%}")
+    lines.append(f"  - Average Placement: {results['agent_d_avg_placement']:.2f}")
+    lines.append(f"  - Placements: {results['agent_d_placements']}")
+    lines.append("")
+
+    lines.append("AGENT E (Ensemble Architecture - GTO + Exploit + Decision):")
+    lines.append(f"  - Wins: {results['agent_e_wins']}")
+    lines.append(f"  - Win Rate: {results['agent_e_win_rate']:.1%}")
+    lines.append(f"  - Average Placement: {results['agent_e_avg_placement']:.2f}")
+    lines.append(f"  - Placements: {results['agent_e_placements']}")
+    lines.append("")
+
+    lines.append("ALL AGENT PLACEMENT DISTRIBUTION:")
+    all_placements = results["all_placements"]
+    for player_id in sorted(all_placements):
+        for placement, count in enumerate(all_placements[player_id], 1):
+            if count:
+                lines.append(f"  - {player_id} placed {placement}: {count} times")
+    lines.append("")
 
     # Print GTO deviation stats
     deviation_stats = results.get("gto_deviation_stats", {})
     if deviation_stats:
-        print("=" * 70)
-        print("📐 GTO DEVIATION ANALYSIS:")
-        print("=" * 70)
+        lines.append("=" * 70)
+        lines.append("📐 GTO DEVIATION ANALYSIS:")
+        lines.append("=" * 70)
 
         summary = deviation_stats.get("summary", {})
         total_gto = summary.get("total_gto_decisions", 0)
@@ -325,13 +366,13 @@ def print_results(results: dict) -> None:
         gto_profit = summary.get("total_gto_profit", 0)
         dev_profit = summary.get("total_deviation_profit", 0)
 
-        print("Overall:")
-        print(f"  - GTO Decisions: {total_gto}")
-        print(f"  - Deviation Decisions: {total_dev}")
-        print(f"  - Deviation Rate: {dev_rate:.1%}")
-        print(f"  - GTO Profit/Loss: {gto_profit:+.0f}")
-        print(f"  - Deviation Profit/Loss: {dev_profit:+.0f}")
-        print()
+        lines.append("Overall:")
+        lines.append(f"  - GTO Decisions: {total_gto}")
+        lines.append(f"  - Deviation Decisions: {total_dev}")
+        lines.append(f"  - Deviation Rate: {dev_rate:.1%}")
+        lines.append(f"  - GTO Profit/Loss: {gto_profit:+.0f}")
+        lines.append(f"  - Deviation Profit/Loss: {dev_profit:+.0f}")
+        lines.append("")
 
         by_agent = deviation_stats.get("by_agent", {})
         for agent_id in ["agent_d", "agent_e"]:
@@ -346,32 +387,32 @@ def print_results(results: dict) -> None:
                 dev_avg = stats.get("deviation_avg_profit", 0)
 
                 agent_label = "Agent D (Simple)" if agent_id == "agent_d" else "Agent E (Ensemble)"
-                print(f"{agent_label}:")
-                print(
+                lines.append(f"{agent_label}:")
+                lines.append(
                     f"  - Decisions: {gto_count} GTO, {dev_count} deviations ({rate:.1%} deviation rate)"
                 )
-                print(f"  - GTO Profit: {gto_p:+.0f} (avg: {gto_avg:+.1f}/hand)")
-                print(f"  - Deviation Profit: {dev_p:+.0f} (avg: {dev_avg:+.1f}/hand)")
+                lines.append(f"  - GTO Profit: {gto_p:+.0f} (avg: {gto_avg:+.1f}/hand)")
+                lines.append(f"  - Deviation Profit: {dev_p:+.0f} (avg: {dev_avg:+.1f}/hand)")
 
                 # Verdict
                 if dev_count > 0 and gto_count > 0:
                     if dev_avg > gto_avg:
-                        print(
+                        lines.append(
                             f"  ✅ Deviations were PROFITABLE (avg +{dev_avg - gto_avg:.1f}/hand better)"
                         )
                     else:
-                        print(
+                        lines.append(
                             f"  ❌ Deviations were COSTLY (avg {dev_avg - gto_avg:.1f}/hand worse)"
                         )
-                print()
+                lines.append("")
 
     # Print EV analysis
     ev_by_player = results.get("ev_by_player", {})
-    print("=" * 70)
-    print("📈 EV ANALYSIS (Showdown Hands Only):")
-    print("=" * 70)
-    print("EV chips = expected result based on equity (luck removed)")
-    print()
+    lines.append("=" * 70)
+    lines.append("📈 EV ANALYSIS (Showdown Hands Only):")
+    lines.append("=" * 70)
+    lines.append("EV chips = expected result based on equity (luck removed)")
+    lines.append("")
 
     # Get showdown counts for both agents
     agent_d_data = ev_by_player.get("agent_d", {})
@@ -388,15 +429,15 @@ def print_results(results: dict) -> None:
             actual_chips = ev_data.get("actual_chips", 0)
             showdowns = ev_data.get("showdown_count", 0)
 
-            print(f"{agent_label} ({showdowns} showdowns):")
-            print(f"  - EV Chips:     {ev_chips:+.0f} (decision quality)")
-            print(f"  - Actual Chips: {actual_chips:+.0f} (what happened)")
-            print()
+            lines.append(f"{agent_label} ({showdowns} showdowns):")
+            lines.append(f"  - EV Chips:     {ev_chips:+.0f} (decision quality)")
+            lines.append(f"  - Actual Chips: {actual_chips:+.0f} (what happened)")
+            lines.append("")
         else:
             # Agent had no showdowns
-            print(f"{agent_label} (0 showdowns):")
-            print("  - No showdown data (won/lost without showing cards)")
-            print()
+            lines.append(f"{agent_label} (0 showdowns):")
+            lines.append("  - No showdown data (won/lost without showing cards)")
+            lines.append("")
 
     # EV-adjusted comparison
     agent_d_ev = agent_d_data.get("ev_chips", 0)
@@ -432,38 +473,42 @@ def print_results(results: dict) -> None:
     agent_d_ev_adjusted_total = agent_d_showdown_ev_adjusted + agent_d_non_showdown
     agent_e_ev_adjusted_total = agent_e_showdown_ev_adjusted + agent_e_non_showdown
 
-    print("EV-Adjusted Total (EV for showdowns + actual for non-showdowns):")
-    print(f"  Agent D: {agent_d_ev_adjusted_total:+.0f} chips")
-    print(
+    lines.append("EV-Adjusted Total (EV for showdowns + actual for non-showdowns):")
+    lines.append(f"  Agent D: {agent_d_ev_adjusted_total:+.0f} chips")
+    lines.append(
         f"    └─ Showdown EV: {agent_d_showdown_ev_adjusted:+.0f} + Non-showdown: {agent_d_non_showdown:+.0f}"
     )
-    print(f"  Agent E: {agent_e_ev_adjusted_total:+.0f} chips")
-    print(
+    lines.append(f"  Agent E: {agent_e_ev_adjusted_total:+.0f} chips")
+    lines.append(
         f"    └─ Showdown EV: {agent_e_showdown_ev_adjusted:+.0f} + Non-showdown: {agent_e_non_showdown:+.0f}"
     )
-    print()
+    lines.append("")
 
-    print("EV-Adjusted Comparison:")
+    lines.append("EV-Adjusted Comparison:")
     ev_adjusted_diff = agent_d_ev_adjusted_total - agent_e_ev_adjusted_total
 
     if agent_d_showdowns == 0 and agent_e_showdowns == 0:
-        print("  ⚠️ No showdowns occurred - using actual chips only")
-        print("  (Results are purely from non-showdown hands)")
+        lines.append("  ⚠️ No showdowns occurred - using actual chips only")
+        lines.append("  (Results are purely from non-showdown hands)")
     elif agent_d_showdowns == 0 or agent_e_showdowns == 0:
         missing = "D" if agent_d_showdowns == 0 else "E"
-        print(f"  ⚠️ Agent {missing} had no showdowns - partial EV adjustment")
+        lines.append(f"  ⚠️ Agent {missing} had no showdowns - partial EV adjustment")
 
     if ev_adjusted_diff > 0:
-        print(f"  ✅ Agent D outperformed Agent E by {ev_adjusted_diff:+.0f} EV-adjusted chips")
+        lines.append(
+            f"  ✅ Agent D outperformed Agent E by {ev_adjusted_diff:+.0f} EV-adjusted chips"
+        )
     elif ev_adjusted_diff < 0:
-        print(f"  ✅ Agent E outperformed Agent D by {-ev_adjusted_diff:+.0f} EV-adjusted chips")
+        lines.append(
+            f"  ✅ Agent E outperformed Agent D by {-ev_adjusted_diff:+.0f} EV-adjusted chips"
+        )
     else:
-        print("  Both agents performed equally (EV-adjusted)")
-    print()
+        lines.append("  Both agents performed equally (EV-adjusted)")
+    lines.append("")
 
-    print("=" * 70)
-    print("CONCLUSION:")
-    print("=" * 70)
+    lines.append("=" * 70)
+    lines.append("CONCLUSION:")
+    lines.append("=" * 70)
 
     if results["agent_d_avg_placement"] < results["agent_e_avg_placement"]:
         improvement = (
@@ -471,30 +516,32 @@ def print_results(results: dict) -> None:
             / results["agent_e_avg_placement"]
             * 100
         )
-        print("✅ SIMPLE ARCHITECTURE WINS!")
-        print(f"   Agent D (single LLM) performs {improvement:.1f}% better")
-        print("   than Agent E (ensemble).")
-        print()
-        print("   Combined GTO+Exploit in one prompt may be more efficient")
-        print("   than separating into specialized agents.")
+        lines.append("✅ SIMPLE ARCHITECTURE WINS!")
+        lines.append(f"   Agent D (single LLM) performs {improvement:.1f}% better")
+        lines.append("   than Agent E (ensemble).")
+        lines.append("")
+        lines.append("   Combined GTO+Exploit in one prompt may be more efficient")
+        lines.append("   than separating into specialized agents.")
     elif results["agent_d_avg_placement"] > results["agent_e_avg_placement"]:
         improvement = (
             (results["agent_d_avg_placement"] - results["agent_e_avg_placement"])
             / results["agent_d_avg_placement"]
             * 100
         )
-        print("✅ ENSEMBLE ARCHITECTURE WINS!")
-        print(f"   Agent E (GTO + Exploit + Decision) performs {improvement:.1f}% better")
-        print("   than Agent D (single LLM).")
-        print()
-        print("   Separating analysis into specialized agents provides")
-        print("   better decision quality despite higher latency.")
+        lines.append("✅ ENSEMBLE ARCHITECTURE WINS!")
+        lines.append(f"   Agent E (GTO + Exploit + Decision) performs {improvement:.1f}% better")
+        lines.append("   than Agent D (single LLM).")
+        lines.append("")
+        lines.append("   Separating analysis into specialized agents provides")
+        lines.append("   better decision quality despite higher latency.")
     else:
-        print("⚖️ INCONCLUSIVE")
-        print("   Both architectures performed similarly.")
-        print("   More tournaments may be needed for statistical significance.")
+        lines.append("⚖️ INCONCLUSIVE")
+        lines.append("   Both architectures performed similarly.")
+        lines.append("   More tournaments may be needed for statistical significance.")
 
-    print("=" * 70)
+    lines.append("=" * 70)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -520,8 +567,22 @@ def main():
         action="store_true",
         help="Enable verbose logging",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Save results without game logs, as unindented JSON",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "msgpack"],
+        default="json",
+        help="Results file format (default: json; msgpack needs the msgpack extra)",
+    )
 
     args = parser.parse_args()
+    # Fail before running any tournament rather than when saving the results
+    if args.format == "msgpack" and importlib.util.find_spec("msgpack") is None:
+        parser.error("--format msgpack requires the msgpack extra (pip install msgpack)")
 
     # Setup logging - check env var first, then verbose flag
     log_level = os.environ.get("LOG_LEVEL", "DEBUG" if args.verbose else "INFO")
@@ -553,7 +614,9 @@ def main():
         print_results(results)
 
         # Save results to file
-        results_file = save_experiment_results(results)
+        results_file = save_experiment_results(
+            results, compact=args.compact, output_format=args.format
+        )
         print(f"\n📊 Results saved to: {results_file}")
 
     except KeyboardInterrupt:
@@ -6,7 +6,9 @@ KnowledgeBase objects for testing poker agents.
 """
 
 import json
+import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -23,27 +25,64 @@ from backend.domain.player.models import (
     PlayerStatistics,
 )
 
+# Shared default for absent sequence fields; scenario game states are never mutated
+_EMPTY_TUPLE: tuple = ()
+
+# Public PlayerStatistics fields that scenarios may set
+_STAT_FIELDS = frozenset(
+    {
+        "hands_played",
+        "vpip",
+        "pfr",
+        "limp_frequency",
+        "three_bet_pct",
+        "fold_to_three_bet",
+        "cbet_flop_pct",
+        "cbet_turn_pct",
+        "cbet_river_pct",
+        "aggression_factor",
+        "river_aggression",
+        "wtsd",
+        "wsd",
+        "avg_bet_sizing",
+        "avg_raise_sizing",
+    }
+)
+
 
 @dataclass
 class ExpectedBehavior:
     """Expected behavior for scenario validation."""
 
-    valid_actions: list[str] = field(default_factory=list)
-    invalid_actions: list[str] = field(default_factory=list)
+    valid_actions: frozenset[str] = frozenset()
+    invalid_actions: frozenset[str] = frozenset()
     min_confidence: float = 0.0
     notes: str = ""
 
 
 @dataclass
 class Scenario:
-    """A complete test scenario with game state and expected behavior."""
+    """A complete test scenario with game state and expected behavior.
+
+    The knowledge base and expected behavior are parsed from the raw scenario
+    data on first access, since many tests only need the game state.
+    """
 
     id: str
     name: str
     description: str
     game_state: StructuredGameState
-    knowledge_base: KnowledgeBase
-    expected: ExpectedBehavior
+    _raw: dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    @cached_property
+    def knowledge_base(self) -> KnowledgeBase:
+        """Opponent knowledge base defined by the scenario."""
+        return _parse_knowledge_base(self._raw.get("knowledge_base", {}))
+
+    @cached_property
+    def expected(self) -> ExpectedBehavior:
+        """Expected behavior used to validate decisions."""
+        return _parse_expected(self._raw.get("expected", {}))
 
 
 def _parse_cards(card_strings: list[str] | None) -> list[Card] | None:
@@ -85,14 +124,14 @@ def _parse_game_state(data: dict[str, Any]) -> StructuredGameState:
         big_blind=float(data["big_blind"]),
         street=_parse_street(data["street"]),
         pot=float(data["pot"]),
-        community_cards=_parse_cards(data.get("community_cards", [])) or [],
+        community_cards=_parse_cards(data.get("community_cards")) or _EMPTY_TUPLE,
         players=[_parse_player_state(p) for p in data["players"]],
         hero_seat=data["hero_seat"],
         current_bet=float(data["current_bet"]),
         min_raise=float(data["min_raise"]),
         max_raise=float(data["max_raise"]),
         legal_actions=[_parse_action_type(a) for a in data["legal_actions"]],
-        action_history=data.get("action_history", []),
+        action_history=data.get("action_history", _EMPTY_TUPLE),
     )
 
 
@@ -100,22 +139,9 @@ def _parse_statistics(data: dict[str, Any]) -> PlayerStatistics:
     """Parse PlayerStatistics from JSON data."""
     stats = PlayerStatistics()
 
-    # Set all the public fields
-    stats.hands_played = data.get("hands_played", 0)
-    stats.vpip = data.get("vpip", 0.0)
-    stats.pfr = data.get("pfr", 0.0)
-    stats.limp_frequency = data.get("limp_frequency", 0.0)
-    stats.three_bet_pct = data.get("three_bet_pct", 0.0)
-    stats.fold_to_three_bet = data.get("fold_to_three_bet", 0.0)
-    stats.cbet_flop_pct = data.get("cbet_flop_pct", 0.0)
-    stats.cbet_turn_pct = data.get("cbet_turn_pct", 0.0)
-    stats.cbet_river_pct = data.get("cbet_river_pct", 0.0)
-    stats.aggression_factor = data.get("aggression_factor", 0.0)
-    stats.river_aggression = data.get("river_aggression", 0.0)
-    stats.wtsd = data.get("wtsd", 0.0)
-    stats.wsd = data.get("wsd", 0.0)
-    stats.avg_bet_sizing = data.get("avg_bet_sizing", 0.0)
-    stats.avg_raise_sizing = data.get("avg_raise_sizing", 0.0)
+    # Only the public fields present in the scenario; the rest keep their defaults
+    for key in data.keys() & _STAT_FIELDS:
+        setattr(stats, key, data[key])
 
     return stats
 
@@ -141,14 +167,14 @@ def _parse_knowledge_base(data: dict[str, Any]) -> KnowledgeBase:
 def _parse_expected(data: dict[str, Any]) -> ExpectedBehavior:
     """Parse ExpectedBehavior from JSON data."""
     return ExpectedBehavior(
-        valid_actions=data.get("valid_actions", []),
-        invalid_actions=data.get("invalid_actions", []),
+        valid_actions=frozenset(data.get("valid_actions", ())),
+        invalid_actions=frozenset(data.get("invalid_actions", ())),
         min_confidence=data.get("min_confidence", 0.0),
         notes=data.get("notes", ""),
     )
 
 
-def load_scenario(filepath: str | Path) -> Scenario:
+def load_scenario(filepath: str | os.PathLike) -> Scenario:
     """
     Load a scenario from a JSON file.
 
@@ -158,22 +184,17 @@ def load_scenario(filepath: str | Path) -> Scenario:
     Returns:
         Scenario object with game state, knowledge base, and expected behavior
     """
-    path = Path(filepath)
-
-    with open(path, "r") as f:
+    with open(filepath, "r") as f:
         data = json.load(f)
 
-    game_state = _parse_game_state(data["structured_game_state"])
-    knowledge_base = _parse_knowledge_base(data.get("knowledge_base", {}))
-    expected = _parse_expected(data.get("expected", {}))
+    stem = os.path.splitext(os.path.basename(filepath))[0]
 
     return Scenario(
-        id=data.get("id", path.stem),
-        name=data.get("name", path.stem),
+        id=data.get("id", stem),
+        name=data.get("name", stem),
         description=data.get("description", ""),
-        game_state=game_state,
-        knowledge_base=knowledge_base,
-        expected=expected,
+        game_state=_parse_game_state(data["structured_game_state"]),
+        _raw=data,
     )
 
 
@@ -187,15 +208,19 @@ def load_scenarios_from_dir(directory: str | Path) -> list[Scenario]:
     Returns:
         List of Scenario objects
     """
-    path = Path(directory)
     scenarios = []
 
-    for json_file in path.rglob("*.json"):
-        try:
-            scenario = load_scenario(json_file)
-            scenarios.append(scenario)
-        except Exception as e:
-            print(f"Warning: Failed to load {json_file}: {e}")
+    # os.walk yields plain names, so non-JSON entries are skipped without building Paths
+    for dirpath, _, filenames in os.walk(directory):
+        for name in filenames:
+            if not name.endswith(".json"):
+                continue
+            json_file = Path(dirpath, name)
+            try:
+                scenario = load_scenario(json_file)
+                scenarios.append(scenario)
+            except Exception as e:
+                print(f"Warning: Failed to load {json_file}: {e}")
 
     return scenarios
 
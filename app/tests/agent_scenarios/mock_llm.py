@@ -0,0 +1,53 @@
+"""
+Canned LLM responses for running the agent scenario tests offline.
+
+Every agent in the project calls the model through Runner.run with a Pydantic
+output_type, so replacing Runner.run is enough to answer GTOAnalyst,
+ExploitAnalyst, DecisionMaker and PokerAgent without network or an API key.
+The canned decision is always a standard 3x raise whatever the scenario, so
+offline runs check plumbing only; decision-quality assertions are skipped
+unless --live-llm is given (see the live_llm fixture).
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+
+from backend.domain.agent.models import ActionDecision, BetSizing
+from backend.domain.agent.specialists import ExploitAnalysisModel, GTOAnalysisModel
+
+CANNED_RESPONSES: dict[type[BaseModel], BaseModel] = {
+    GTOAnalysisModel: GTOAnalysisModel(
+        hand_strength="strong",
+        position_assessment="early",
+        recommended_action="raise",
+        bet_sizing="3x",
+        reasoning="Canned GTO analysis",
+        confidence=0.8,
+    ),
+    ExploitAnalysisModel: ExploitAnalysisModel(
+        opponent_type="unknown",
+        key_tendencies=[],
+        exploitable_leaks=[],
+        recommended_adjustment="None",
+        reasoning="Canned exploit analysis",
+        confidence=0.5,
+    ),
+    ActionDecision: ActionDecision(
+        gto_analysis="Canned GTO analysis",
+        exploit_analysis="Canned exploit analysis",
+        is_following_gto=True,
+        gto_deviation="Following GTO because this is a canned response",
+        action_type="raise",
+        sizing=BetSizing(bb_multiple=3),
+        confidence=0.8,
+    ),
+}
+
+
+async def mock_runner_run(agent, input, *args, **kwargs) -> SimpleNamespace:
+    """Stand-in for Runner.run returning the canned output for agent.output_type."""
+    # Yield once like a real request would, so gathered calls still interleave
+    await asyncio.sleep(0)
+    return SimpleNamespace(final_output=CANNED_RESPONSES[agent.output_type], new_items=[])
@@ -67,7 +67,7 @@ class TestAgentASingleScenario:
     """Test Agent A with a single scenario for quick validation."""
 
     @pytest.mark.asyncio
-    async def test_preflop_aa(self, settings: Settings):
+    async def test_preflop_aa(self, settings: Settings, live_llm: bool):
         """Test Agent A with premium AA preflop - should raise aggressively."""
         scenario_path = SCENARIOS_DIR / "preflop" / "premium_aa_utg.json"
 
@@ -91,7 +91,10 @@ class TestAgentASingleScenario:
         print_decision("AGENT A (Bluffer)", "🎭", decision, action)
 
         # AA should raise or all-in, never fold - even for a bluffer
-        assert action.type.value in ["raise", "all_in"], f"AA should raise, got {action.type.value}"
+        if live_llm:
+            assert action.type.value in ["raise", "all_in"], (
+                f"AA should raise, got {action.type.value}"
+            )
 
     @pytest.mark.asyncio
     async def test_river_bluff_catch(self, settings: Settings):
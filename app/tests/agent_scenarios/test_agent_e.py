@@ -5,37 +5,112 @@ These tests run Agent E (multi-agent ensemble: GTO + Exploit + Decision)
 against JSON-defined scenarios to validate decision quality and reasoning.
 """
 
+import asyncio
+import os
+
 import pytest
 
 from backend.config import Settings
 from backend.domain.agent.ensemble_agent import EnsemblePokerAgent
+from backend.domain.agent.models import ActionDecision
 from backend.domain.agent.poker_agent import PokerAgent
+from backend.domain.agent.specialists import ExploitAnalysis, GTOAnalysis
 from backend.domain.agent.strategies.base import AGENT_D_INFORMED, AGENT_E_ENSEMBLE
-from tests.agent_scenarios.loader import load_scenario
+from backend.domain.player.models import KnowledgeBase
 from tests.agent_scenarios.utils import (
-    SCENARIOS_DIR,
+    PREMIUM_AA_SCENARIO,
     get_all_scenarios,
+    get_scenario,
     print_decision,
     print_decision_compact,
     print_scenario_header,
     print_test_header,
+    run_agent_e,
+    track_analysis_concurrency,
     validate_decision,
 )
 
 AGENT_E_STRATEGY = AGENT_E_ENSEMBLE
 AGENT_D_STRATEGY = AGENT_D_INFORMED
 
-
+# Resolved once for both parametrized classes; explicit ids keep pytest
+# from building ids out of the Path objects
+SCENARIOS = get_all_scenarios()
+SCENARIO_IDS = [scenario_id for scenario_id, _ in SCENARIOS]
+
+
+@pytest.fixture(scope="module")
+def agent_e_factory(settings: Settings):
+    """
+    Build Agent E once per knowledge base for the whole module.
+
+    Scenarios come from the session cache, so a scenario's knowledge base
+    is the same object in every test and its agent can be reused as-is.
+    """
+    agents: dict[int, EnsemblePokerAgent] = {}
+
+    def make(knowledge_base: KnowledgeBase) -> EnsemblePokerAgent:
+        agent = agents.get(id(knowledge_base))
+        if agent is None:
+            agent = agents[id(knowledge_base)] = EnsemblePokerAgent(
+                player_id="agent_e",
+                strategy=AGENT_E_STRATEGY,
+                knowledge_base=knowledge_base,
+                settings=settings,
+            )
+        return agent
+
+    return make
+
+
+@pytest.fixture(scope="module")
+async def prefetch_agent_e_decisions(
+    request: pytest.FixtureRequest,
+    agent_e_factory,
+    scenario_cache: dict,
+    session_decision_cache: dict,
+) -> None:
+    """
+    Decide every selected scenario up front, all at once, before the tests validate.
+
+    Each scenario test otherwise waits on its own three LLM round-trips in
+    turn. Only scenarios of collected tests that use this fixture are
+    decided, so a -k selection pays only for what it runs. LLM_CONCURRENCY
+    caps how many ensembles are in flight together.
+    """
+    selected = {
+        item.callspec.params["scenario_id"]
+        for item in request.session.items
+        if "prefetch_agent_e_decisions" in getattr(item, "fixturenames", ())
+        and "scenario_id" in getattr(getattr(item, "callspec", None), "params", {})
+    }
+    semaphore = asyncio.Semaphore(int(os.environ.get("LLM_CONCURRENCY", "8")))
+
+    async def decide(scenario_id: str, scenario_path: str) -> None:
+        scenario = get_scenario(scenario_path, scenario_cache)
+        agent = agent_e_factory(scenario.knowledge_base)
+        async with semaphore:
+            await run_agent_e(agent, scenario, scenario_id, session_decision_cache)
+
+    await asyncio.gather(
+        *(decide(scenario_id, path) for scenario_id, path in SCENARIOS if scenario_id in selected)
+    )
+
+
+@pytest.mark.usefixtures("prefetch_agent_e_decisions")
 class TestAgentEScenarios:
     """Test Agent E against various poker scenarios."""
 
     @pytest.mark.asyncio
-    @pytest.mark.parametrize("scenario_id,scenario_path", get_all_scenarios())
+    @pytest.mark.parametrize("scenario_id,scenario_path", SCENARIOS, ids=SCENARIO_IDS)
     async def test_scenario(
         self,
         scenario_id: str,
-        scenario_path,
-        settings: Settings,
+        scenario_path: str,
+        scenario_cache: dict,
+        decision_cache: dict,
+        agent_e_factory,
+        live_llm: bool,
     ):
         """
         Test Agent E's decision on a specific scenario.
@@ -47,33 +122,30 @@ class TestAgentEScenarios:
         4. Prints full decision output
         5. Validates against expected behavior
         """
-        scenario = load_scenario(scenario_path)
+        scenario = get_scenario(scenario_path, scenario_cache)
         print_scenario_header(scenario)
 
-        agent = EnsemblePokerAgent(
-            player_id="agent_e",
-            strategy=AGENT_E_STRATEGY,
-            knowledge_base=scenario.knowledge_base,
-            settings=settings,
-        )
-
-        decision = await agent.decide(scenario.game_state)
-        action = decision.to_action(scenario.game_state)
+        agent = agent_e_factory(scenario.knowledge_base)
+        decision, action = await run_agent_e(agent, scenario, scenario_id, decision_cache)
 
         print_decision("AGENT E (ENSEMBLE)", "🎭", decision, action)
-        validate_decision(action, decision, scenario)
+        validate_decision(action, decision, scenario, check_decision=live_llm)
 
 
+@pytest.mark.usefixtures("prefetch_agent_e_decisions")
 class TestAgentEComparison:
     """Compare Agent E and Agent D on the same scenarios."""
 
     @pytest.mark.asyncio
-    @pytest.mark.parametrize("scenario_id,scenario_path", get_all_scenarios())
+    @pytest.mark.parametrize("scenario_id,scenario_path", SCENARIOS, ids=SCENARIO_IDS)
     async def test_compare_agents(
         self,
         scenario_id: str,
-        scenario_path,
+        scenario_path: str,
         settings: Settings,
+        scenario_cache: dict,
+        decision_cache: dict,
+        agent_e_factory,
     ):
         """
         Compare Agent D and Agent E decisions on the same scenario.
@@ -83,7 +155,7 @@ class TestAgentEComparison:
         - Confidence level
         - Reasoning quality
         """
-        scenario = load_scenario(scenario_path)
+        scenario = get_scenario(scenario_path, scenario_cache)
 
         print(f"\n{'=' * 70}")
         print(f"COMPARISON: {scenario.name}")
@@ -100,16 +172,19 @@ class TestAgentEComparison:
             settings=settings,
         )
 
-        agent_e = EnsemblePokerAgent(
-            player_id="agent_e",
-            strategy=AGENT_E_STRATEGY,
-            knowledge_base=scenario.knowledge_base,
-            settings=settings,
-        )
-
-        # Run both agents
-        decision_d = await agent_d.decide(scenario.game_state)
-        decision_e = await agent_e.decide(scenario.game_state)
+        # Reuse Agent E's decision from TestAgentEScenarios when available
+        key = (scenario_id, "agent_e")
+        decision_e = decision_cache.get(key)
+        if decision_e is None:
+            agent_e = agent_e_factory(scenario.knowledge_base)
+            # Run both agents concurrently - they are independent and I/O bound
+            decision_d, decision_e = await asyncio.gather(
+                agent_d.decide(scenario.game_state),
+                agent_e.decide(scenario.game_state),
+            )
+            decision_cache[key] = decision_e
+        else:
+            decision_d = await agent_d.decide(scenario.game_state)
 
         action_d = decision_d.to_action(scenario.game_state)
         action_e = decision_e.to_action(scenario.game_state)
@@ -124,9 +199,14 @@ class TestAgentEComparison:
         print_decision_compact("Agent E", decision_e, action_e)
 
         # Compare
-        same_action = action_d.type.value == action_e.type.value
+        action_type_d = action_d.type.value
+        action_type_e = action_e.type.value
+        same_action = action_type_d == action_type_e
         print(f"\n{'=' * 70}")
-        print(f"{'✅' if same_action else '⚠️'} Same action type: {same_action}")
+        print(
+            f"{'✅' if same_action else '⚠️'} Same action type: {same_action} "
+            f"(D: {action_type_d}, E: {action_type_e})"
+        )
         print(f"{'=' * 70}")
 
 
@@ -134,26 +214,72 @@ class TestAgentESingleScenario:
     """Test Agent E with a single scenario for quick validation."""
 
     @pytest.mark.asyncio
-    async def test_preflop_aa(self, settings: Settings):
+    async def test_preflop_aa(
+        self, scenario_cache: dict, decision_cache: dict, agent_e_factory, live_llm: bool
+    ):
         """Test Agent E with premium AA preflop - should raise."""
-        scenario_path = SCENARIOS_DIR / "preflop" / "premium_aa_utg.json"
+        if not os.path.exists(PREMIUM_AA_SCENARIO):
+            pytest.skip(f"Scenario file not found: {PREMIUM_AA_SCENARIO}")
+
+        scenario = get_scenario(PREMIUM_AA_SCENARIO, scenario_cache)
+
+        agent = agent_e_factory(scenario.knowledge_base)
+        decision, action = await run_agent_e(
+            agent, scenario, "preflop_premium_aa_utg", decision_cache
+        )
+
+        print_test_header("AA Preflop Test", "Agent E (Ensemble)")
+        print_decision("AGENT E (ENSEMBLE)", "🎭", decision, action)
 
-        if not scenario_path.exists():
-            pytest.skip(f"Scenario file not found: {scenario_path}")
+        if live_llm:
+            assert action.type.value in ["raise", "all_in"], (
+                f"AA should raise, got {action.type.value}"
+            )
 
-        scenario = load_scenario(scenario_path)
 
+class TestAgentEParallelAnalysis:
+    """Check the ensemble's analysis fan-out without real LLM calls."""
+
+    @pytest.mark.asyncio
+    async def test_gto_and_exploit_run_concurrently(self, scenario_cache: dict):
+        """GTO and Exploit analyses are awaited together before the Decision call."""
+        if not os.path.exists(PREMIUM_AA_SCENARIO):
+            pytest.skip(f"Scenario file not found: {PREMIUM_AA_SCENARIO}")
+
+        scenario = get_scenario(PREMIUM_AA_SCENARIO, scenario_cache)
         agent = EnsemblePokerAgent(
             player_id="agent_e",
             strategy=AGENT_E_STRATEGY,
             knowledge_base=scenario.knowledge_base,
-            settings=settings,
+            settings=Settings(),
         )
 
-        decision = await agent.decide(scenario.game_state)
-        action = decision.to_action(scenario.game_state)
+        async def fake_gto(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return GTOAnalysis("premium", "early", "raise", "3x", "AA opens", 0.9)
+
+        async def fake_exploit(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return ExploitAnalysis("unknown", [], [], "none", "no reads", 0.5)
+
+        async def fake_decide(*args, **kwargs):
+            # Both analyses must have finished before the decision is made
+            assert concurrency.in_flight == 0
+            return ActionDecision(
+                gto_analysis="Raise AA",
+                exploit_analysis="No reads",
+                is_following_gto=True,
+                gto_deviation="Following GTO because AA is a standard open",
+                action_type="raise",
+                confidence=0.9,
+            )
+
+        agent._gto_analyst.analyze = fake_gto
+        agent._exploit_analyst.analyze = fake_exploit
+        agent._decision_maker.decide = fake_decide
+        concurrency = track_analysis_concurrency(agent)
 
-        print_test_header("AA Preflop Test", "Agent E (Ensemble)")
-        print_decision("AGENT E (ENSEMBLE)", "🎭", decision, action)
+        decision = await agent.decide(scenario.game_state)
 
-        assert action.type.value in ["raise", "all_in"], f"AA should raise, got {action.type.value}"
+        assert decision.action_type == "raise"
+        assert concurrency.max_in_flight == 2
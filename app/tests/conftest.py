@@ -1,13 +1,17 @@
 """
-Pytest configuration and shared fixtures for agent scenario tests.
+Pytest configuration and shared fixtures for the test suite.
 """
 
 import os
+from collections.abc import Iterator
 
 import pytest
+from agents import Runner
 
 from backend.config import Settings
+from backend.domain.game.environment import PokerEnvironment
 from backend.logging_config import setup_logging
+from tests.agent_scenarios.mock_llm import mock_runner_run
 
 # Configure pytest-asyncio
 pytest_plugins = ["pytest_asyncio"]
@@ -18,28 +22,109 @@ def pytest_configure(config):
     # Set up logging based on LOG_LEVEL env var
     log_level = os.environ.get("LOG_LEVEL", "INFO")
     setup_logging(log_level)
+    config.addinivalue_line(
+        "markers", "fresh_decision: always call the LLM instead of reusing a cached decision"
+    )
+
+
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--live-llm",
+        action="store_true",
+        default=False,
+        help="Run agent scenario tests against the real LLM instead of canned responses",
+    )
+
+
+@pytest.fixture(scope="session")
+def live_llm(request) -> bool:
+    """
+    Whether agents call the real LLM (--live-llm) rather than canned responses.
+
+    Canned responses only exercise the plumbing, so tests use this to skip
+    assertions about the quality of a decision.
+    """
+    return request.config.getoption("--live-llm")
 
 
 @pytest.fixture(scope="session")
-def settings() -> Settings:
+def settings(live_llm: bool) -> Iterator[Settings]:
     """
     Load settings from environment.
 
-    Requires OPENAI_API_KEY to be set (either in .env or environment).
-    Skips tests if API key is not available.
+    By default every agent gets canned LLM responses (see mock_llm.py), so
+    the scenario tests run offline. With --live-llm, OPENAI_API_KEY must be
+    set (either in .env or environment) and tests are skipped without it.
     """
+    if not live_llm:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(Runner, "run", staticmethod(mock_runner_run))
+            yield Settings()
+        return
+
     try:
         s = Settings()
         if not s.openai_api_key:
             pytest.skip("OPENAI_API_KEY not set - skipping LLM tests")
         # Configure the OpenAI client
         s.configure_openai_client()
-        return s
     except Exception as e:
         pytest.skip(f"Failed to load settings: {e}")
+    yield s
 
 
 @pytest.fixture(scope="session")
 def scenarios_dir() -> str:
     """Get the path to the scenarios directory."""
     return os.path.join(os.path.dirname(__file__), "agent_scenarios", "scenarios")
+
+
+@pytest.fixture(scope="session")
+def scenario_cache() -> dict:
+    """Parsed scenarios keyed by path, shared by every test in the session."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def session_decision_cache() -> dict:
+    """The shared decision store behind decision_cache, for session-wide prefetching."""
+    return {}
+
+
+@pytest.fixture
+def decision_cache(request, session_decision_cache) -> dict:
+    """
+    Agent decisions keyed by (scenario_id, agent_id), shared across the session.
+
+    Lets a second test class reuse a decision instead of paying for the same
+    LLM calls again. Tests marked fresh_decision get an empty cache.
+    """
+    if request.node.get_closest_marker("fresh_decision"):
+        return {}
+    return session_decision_cache
+
+
+@pytest.fixture(scope="module")
+def env_factory():
+    """
+    Share one PokerEnvironment per table configuration across a test module.
+
+    Tests call env.reset(stacks) to start from a clean tournament instead of
+    constructing a new environment each time.
+    """
+    envs: dict[tuple, PokerEnvironment] = {}
+
+    def make(player_names, starting_stack, small_blind=10, big_blind=20) -> PokerEnvironment:
+        key = (tuple(player_names), starting_stack, small_blind, big_blind)
+        env = envs.get(key)
+        if env is None:
+            env = envs[key] = PokerEnvironment(
+                player_names=list(player_names),
+                starting_stack=starting_stack,
+                small_blind=small_blind,
+                big_blind=big_blind,
+            )
+        return env
+
+    return make
@@ -11,121 +11,73 @@ These tests verify critical functionality:
 
 import pytest
 
-from backend.domain.game.environment import PokerEnvironment
 from backend.domain.game.models import Action, ActionType
 
+FIVE_PLAYERS = ("alice", "bob", "charlie", "diana", "eve")
+THREE_PLAYERS = ("alice", "bob", "charlie")
+CHECK_FOLD_CALL = (ActionType.CHECK, ActionType.FOLD, ActionType.CALL)
+
 
 class TestSeatMapping:
     """Test seat index translation between original and PokerKit indices."""
 
-    def test_initial_mapping_all_players_active(self):
-        """All players active: mapping should be identity (0->0, 1->1, etc.)."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
-        env.start_hand()
-
-        # All 5 players should be active
-        assert len(env._active_original_seats) == 5
-        assert env._active_original_seats == [0, 1, 2, 3, 4]
-
-        # Mapping should be identity
-        for i in range(5):
-            assert env._original_to_pokerkit_seat(i) == i
-            assert env._pokerkit_to_original_seat(i) == i
-
-    def test_mapping_after_one_elimination(self):
-        """After player 2 is eliminated, mapping should skip them."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
-
-        # Manually set stacks with one player at 0
-        env._current_stacks = [1000.0, 1000.0, 0.0, 1000.0, 1000.0]
-
-        env.start_hand()
-
-        # Should have 4 active players
-        assert len(env._active_original_seats) == 4
-        assert env._active_original_seats == [0, 1, 3, 4]
-
-        # Test mapping
-        assert env._original_to_pokerkit_seat(0) == 0  # alice -> pk 0
-        assert env._original_to_pokerkit_seat(1) == 1  # bob -> pk 1
-        assert env._original_to_pokerkit_seat(2) is None  # charlie eliminated
-        assert env._original_to_pokerkit_seat(3) == 2  # diana -> pk 2
-        assert env._original_to_pokerkit_seat(4) == 3  # eve -> pk 3
-
-        # Reverse mapping
-        assert env._pokerkit_to_original_seat(0) == 0  # pk 0 -> alice
-        assert env._pokerkit_to_original_seat(1) == 1  # pk 1 -> bob
-        assert env._pokerkit_to_original_seat(2) == 3  # pk 2 -> diana
-        assert env._pokerkit_to_original_seat(3) == 4  # pk 3 -> eve
-
-    def test_mapping_after_multiple_eliminations(self):
-        """Multiple eliminations should be handled correctly."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
+    @pytest.mark.parametrize(
+        "stacks,expected_active,expected_mapping",
+        [
+            # All players active: mapping is the identity
+            ([1000.0] * 5, [0, 1, 2, 3, 4], [0, 1, 2, 3, 4]),
+            # charlie (seat 2) eliminated: mapping skips them
+            ([1000.0, 1000.0, 0.0, 1000.0, 1000.0], [0, 1, 3, 4], [0, 1, None, 2, 3]),
+            # bob (1) and diana (3) eliminated
+            ([1000.0, 0.0, 1000.0, 0.0, 1000.0], [0, 2, 4], [0, None, 1, None, 2]),
+            # Heads-up: only alice (0) and eve (4) remain
+            ([2500.0, 0.0, 0.0, 0.0, 2500.0], [0, 4], [0, None, None, None, 1]),
+            # First seat eliminated
+            ([0.0, 150.0, 150.0], [1, 2], [None, 0, 1]),
+            # Last (highest) seat eliminated
+            ([150.0, 150.0, 0.0], [0, 1], [0, 1, None]),
+            # Alternating seats 0, 2, 4 eliminated
+            ([0.0, 200.0, 0.0, 200.0, 0.0], [1, 3], [None, 0, None, 1, None]),
+        ],
+        ids=[
+            "all_active",
+            "one_elimination",
+            "multiple_eliminations",
+            "heads_up",
+            "first_player_eliminated",
+            "last_player_eliminated",
+            "alternating_eliminations",
+        ],
+    )
+    def test_seat_mapping(self, env_factory, stacks, expected_active, expected_mapping):
+        """Active seats and both mapping directions should skip eliminated players."""
+        env = env_factory(FIVE_PLAYERS[: len(stacks)], starting_stack=1000)
+        env.reset(stacks)
+
+        assert env._active_original_seats == expected_active
+        assert env._original_to_pokerkit == expected_mapping
+        # The seat helpers translate both directions through those tables
+        assert [env._pokerkit_to_original_seat(i) for i in range(len(expected_active))] == (
+            expected_active
         )
+        assert [env._original_to_pokerkit_seat(i) for i in range(len(stacks))] == expected_mapping
 
-        # Players 1 (bob) and 3 (diana) eliminated
-        env._current_stacks = [1000.0, 0.0, 1000.0, 0.0, 1000.0]
+    @pytest.mark.parametrize("original_index", [-1, 5, 99])
+    def test_out_of_range_seat_maps_to_none(self, env_factory, original_index):
+        """Seat indices outside the table should map to no PokerKit seat."""
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
+        env.reset()
 
-        env.start_hand()
-
-        # Should have 3 active players
-        assert len(env._active_original_seats) == 3
-        assert env._active_original_seats == [0, 2, 4]
-
-        # Test mapping
-        assert env._original_to_pokerkit_seat(0) == 0  # alice -> pk 0
-        assert env._original_to_pokerkit_seat(1) is None  # bob eliminated
-        assert env._original_to_pokerkit_seat(2) == 1  # charlie -> pk 1
-        assert env._original_to_pokerkit_seat(3) is None  # diana eliminated
-        assert env._original_to_pokerkit_seat(4) == 2  # eve -> pk 2
-
-    def test_heads_up_after_eliminations(self):
-        """When only 2 players remain, mapping should work correctly."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
-
-        # Only players 0 (alice) and 4 (eve) remain
-        env._current_stacks = [2500.0, 0.0, 0.0, 0.0, 2500.0]
-
-        env.start_hand()
-
-        assert len(env._active_original_seats) == 2
-        assert env._active_original_seats == [0, 4]
-
-        assert env._original_to_pokerkit_seat(0) == 0  # alice -> pk 0
-        assert env._original_to_pokerkit_seat(4) == 1  # eve -> pk 1
+        assert env._original_to_pokerkit_seat(original_index) is None
 
 
 class TestActorIndexAfterElimination:
     """Test that get_current_actor_index returns correct ORIGINAL seat index."""
 
-    def test_actor_index_with_all_players(self):
+    def test_actor_index_with_all_players(self, env_factory):
         """With all players, actor index should match directly."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
-        env.start_hand()
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
+        env.reset()
 
         # First actor should be an original seat index (UTG = seat 2 in 5-player)
         actor_idx = env.get_current_actor_index()
@@ -133,18 +85,12 @@ class TestActorIndexAfterElimination:
         actor_name = env.player_names[actor_idx]
         assert actor_name in ["alice", "bob", "charlie", "diana", "eve"]
 
-    def test_actor_index_after_elimination(self):
+    def test_actor_index_after_elimination(self, env_factory):
         """After elimination, actor index should be original seat index, not PokerKit index."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
 
         # Eliminate charlie (seat 2)
-        env._current_stacks = [1000.0, 1000.0, 0.0, 1000.0, 1000.0]
-        env.start_hand()
+        env.reset([1000.0, 1000.0, 0.0, 1000.0, 1000.0])
 
         actor_idx = env.get_current_actor_index()
         assert actor_idx is not None
@@ -161,18 +107,12 @@ class TestActorIndexAfterElimination:
 class TestStructuredStateAfterElimination:
     """Test that get_structured_state includes all original players with correct info."""
 
-    def test_structured_state_includes_eliminated_players(self):
+    def test_structured_state_includes_eliminated_players(self, env_factory):
         """Eliminated players should appear in state as inactive with 0 stack."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
 
         # Eliminate charlie (seat 2)
-        env._current_stacks = [1000.0, 1000.0, 0.0, 1000.0, 1000.0]
-        env.start_hand()
+        env.reset([1000.0, 1000.0, 0.0, 1000.0, 1000.0])
 
         actor_idx = env.get_current_actor_index()
         state = env.get_structured_state(actor_idx)
@@ -192,18 +132,12 @@ class TestStructuredStateAfterElimination:
             player = state.players[i]
             assert player.is_active is True or player.stack > 0
 
-    def test_hero_hole_cards_with_elimination(self):
+    def test_hero_hole_cards_with_elimination(self, env_factory):
         """Hero should see their hole cards even after elimination mapping."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
 
         # Eliminate alice (seat 0) - affects mapping
-        env._current_stacks = [0.0, 1000.0, 1000.0, 1000.0, 1000.0]
-        env.start_hand()
+        env.reset([0.0, 1000.0, 1000.0, 1000.0, 1000.0])
 
         # Get state for diana (original seat 3, now pk seat 2)
         state = env.get_structured_state(3)
@@ -218,22 +152,31 @@ class TestStructuredStateAfterElimination:
         for i in [1, 2, 4]:
             assert state.players[i].hole_cards is None
 
+    def test_structured_state_reused_until_state_changes(self, env_factory):
+        """Repeated reads in one step share a snapshot; an action invalidates it."""
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
+        env.reset([1000.0, 1000.0, 0.0, 1000.0, 1000.0])
+
+        actor_idx = env.get_current_actor_index()
+        state = env.get_structured_state(actor_idx)
+        assert env.get_structured_state(actor_idx) is state
+
+        env.execute_action(actor_idx, Action(type=ActionType.FOLD))
+
+        next_state = env.get_structured_state(actor_idx)
+        assert next_state is not state
+        assert len(next_state.action_history) == 1
+
 
 class TestExecuteActionAfterElimination:
     """Test that execute_action works with original seat indices after elimination."""
 
-    def test_execute_action_with_original_index(self):
+    def test_execute_action_with_original_index(self, env_factory):
         """execute_action should accept original seat index, not PokerKit index."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
 
         # Eliminate charlie (seat 2)
-        env._current_stacks = [1000.0, 1000.0, 0.0, 1000.0, 1000.0]
-        env.start_hand()
+        env.reset([1000.0, 1000.0, 0.0, 1000.0, 1000.0])
 
         # Get current actor (should be original index)
         actor_idx = env.get_current_actor_index()
@@ -244,18 +187,12 @@ class TestExecuteActionAfterElimination:
         assert result["success"] is True
         assert result["player"] == actor_idx  # Should return original index
 
-    def test_execute_action_for_eliminated_player_fails(self):
+    def test_execute_action_for_eliminated_player_fails(self, env_factory):
         """Executing action for eliminated player should raise error."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
 
         # Eliminate charlie (seat 2)
-        env._current_stacks = [1000.0, 1000.0, 0.0, 1000.0, 1000.0]
-        env.start_hand()
+        env.reset([1000.0, 1000.0, 0.0, 1000.0, 1000.0])
 
         # Try to execute action for eliminated player
         with pytest.raises(ValueError, match="has been eliminated"):
@@ -265,33 +202,15 @@ class TestExecuteActionAfterElimination:
 class TestCompleteHandAfterElimination:
     """Test that complete_hand returns correct original indices."""
 
-    def test_winner_uses_original_index(self):
+    def test_winner_uses_original_index(self, env_factory):
         """Winner index should be original seat index, not PokerKit index."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
 
         # Eliminate charlie (seat 2)
-        env._current_stacks = [1000.0, 1000.0, 0.0, 1000.0, 1000.0]
-        env.start_hand()
+        env.reset([1000.0, 1000.0, 0.0, 1000.0, 1000.0])
 
         # Play until hand complete - everyone folds to last player
-        while not env.is_hand_complete():
-            actor_idx = env.get_current_actor_index()
-            if actor_idx is None:
-                break
-
-            # Everyone folds
-            legal = env.get_structured_state(actor_idx).legal_actions
-            if ActionType.FOLD in legal:
-                env.execute_action(actor_idx, Action(type=ActionType.FOLD))
-            elif ActionType.CHECK in legal:
-                env.execute_action(actor_idx, Action(type=ActionType.CHECK))
-            else:
-                env.execute_action(actor_idx, Action(type=ActionType.CALL))
+        env.run_to_completion()
 
         result = env.complete_hand()
 
@@ -301,33 +220,30 @@ class TestCompleteHandAfterElimination:
             winner_name = env.player_names[winner]
             assert winner_name in ["alice", "bob", "diana", "eve"]
 
-    def test_stacks_updated_correctly_after_elimination(self):
+    def test_hand_complete_tracks_state_transitions(self, env_factory):
+        """is_hand_complete() should flip exactly when the last fold ends the hand."""
+        env = env_factory(THREE_PLAYERS, starting_stack=100)
+        env.reset()
+        assert env.is_hand_complete() is False
+
+        env.execute_action(env.get_current_actor_index(), Action(type=ActionType.FOLD))
+        assert env.is_hand_complete() is False
+
+        env.execute_action(env.get_current_actor_index(), Action(type=ActionType.FOLD))
+        assert env.is_hand_complete() is True
+        assert env.is_hand_complete() == (not env._state.status)
+        assert env.get_current_actor_index() is None
+
+    def test_stacks_updated_correctly_after_elimination(self, env_factory):
         """Current stacks should update correctly for original indices."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=1000,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(FIVE_PLAYERS, starting_stack=1000)
 
         # Eliminate charlie (seat 2)
-        env._current_stacks = [1000.0, 1000.0, 0.0, 1000.0, 1000.0]
+        env.reset([1000.0, 1000.0, 0.0, 1000.0, 1000.0])
         initial_total = sum(env._current_stacks)
 
-        env.start_hand()
-
         # Play the hand
-        while not env.is_hand_complete():
-            actor_idx = env.get_current_actor_index()
-            if actor_idx is None:
-                break
-            legal = env.get_structured_state(actor_idx).legal_actions
-            if ActionType.FOLD in legal:
-                env.execute_action(actor_idx, Action(type=ActionType.FOLD))
-            elif ActionType.CHECK in legal:
-                env.execute_action(actor_idx, Action(type=ActionType.CHECK))
-            else:
-                env.execute_action(actor_idx, Action(type=ActionType.CALL))
+        env.run_to_completion()
 
         env.complete_hand()
 
@@ -342,17 +258,12 @@ class TestCompleteHandAfterElimination:
 class TestMultiHandTournament:
     """Test multi-hand tournaments with eliminations between hands."""
 
-    def test_continue_after_elimination(self):
+    def test_continue_after_elimination(self, env_factory):
         """Tournament should continue after a player is eliminated."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie"],
-            starting_stack=100,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(THREE_PLAYERS, starting_stack=100)
 
         # Hand 1: charlie goes all-in and loses
-        env.start_hand()
+        env.reset()
 
         # Simulate charlie losing all chips
         env._current_stacks = [150.0, 150.0, 0.0]
@@ -362,38 +273,22 @@ class TestMultiHandTournament:
         env.start_hand()
 
         assert env.get_active_player_count() == 2
-        assert len(env._active_original_seats) == 2
         assert env._active_original_seats == [0, 1]
 
         # Should be able to play the hand
         actor_idx = env.get_current_actor_index()
         assert actor_idx in [0, 1]
 
-    def test_progressive_eliminations(self):
+    def test_progressive_eliminations(self, env_factory):
         """Multiple players eliminated over several hands."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana", "eve"],
-            starting_stack=100,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(FIVE_PLAYERS, starting_stack=100)
 
         # Hand 1: All players active
-        env.start_hand()
-        assert len(env._active_original_seats) == 5
+        env.reset()
+        assert env._active_original_seats == [0, 1, 2, 3, 4]
 
         # Play through hand 1 (simplified - just fold around)
-        while not env.is_hand_complete():
-            actor = env.get_current_actor_index()
-            if actor is None:
-                break
-            legal = env.get_structured_state(actor).legal_actions
-            if ActionType.CHECK in legal:
-                env.execute_action(actor, Action(type=ActionType.CHECK))
-            elif ActionType.FOLD in legal:
-                env.execute_action(actor, Action(type=ActionType.FOLD))
-            else:
-                env.execute_action(actor, Action(type=ActionType.CALL))
+        env.run_to_completion(CHECK_FOLD_CALL)
         env.complete_hand()
 
         # Simulate eve (seat 4) elimination
@@ -401,21 +296,10 @@ class TestMultiHandTournament:
 
         # Hand 2: 4 players
         env.start_hand()
-        assert len(env._active_original_seats) == 4
-        assert 4 not in env._active_original_seats
+        assert env._active_original_seats == [0, 1, 2, 3]
 
         # Play through hand 2
-        while not env.is_hand_complete():
-            actor = env.get_current_actor_index()
-            if actor is None:
-                break
-            legal = env.get_structured_state(actor).legal_actions
-            if ActionType.CHECK in legal:
-                env.execute_action(actor, Action(type=ActionType.CHECK))
-            elif ActionType.FOLD in legal:
-                env.execute_action(actor, Action(type=ActionType.FOLD))
-            else:
-                env.execute_action(actor, Action(type=ActionType.CALL))
+        env.run_to_completion(CHECK_FOLD_CALL)
         env.complete_hand()
 
         # Simulate bob (seat 1) elimination
@@ -423,98 +307,42 @@ class TestMultiHandTournament:
 
         # Hand 3: 3 players (alice, charlie, diana)
         env.start_hand()
-        assert len(env._active_original_seats) == 3
         assert env._active_original_seats == [0, 2, 3]
 
-        # Verify correct mapping
-        assert env._original_to_pokerkit_seat(0) == 0  # alice
-        assert env._original_to_pokerkit_seat(1) is None  # bob eliminated
-        assert env._original_to_pokerkit_seat(2) == 1  # charlie
-        assert env._original_to_pokerkit_seat(3) == 2  # diana
-        assert env._original_to_pokerkit_seat(4) is None  # eve eliminated
+        # Verify correct mapping: bob and eve eliminated
+        assert env._original_to_pokerkit == [0, None, 1, 2, None]
+
+    def test_reset_restarts_tournament(self, env_factory):
+        """reset() should discard previous hands and eliminations."""
+        env = env_factory(THREE_PLAYERS, starting_stack=100)
+        env.reset([150.0, 150.0, 0.0])
+        env.execute_action(env.get_current_actor_index(), Action(type=ActionType.FOLD))
 
-    def test_tournament_ends_with_one_player(self):
+        env.reset()
+
+        assert env._hand_number == 1
+        assert env._action_history == []
+        assert env._current_stacks == [100.0, 100.0, 100.0]
+        assert env._active_original_seats == [0, 1, 2]
+
+    def test_tournament_ends_with_one_player(self, env_factory):
         """Tournament should not start hand with < 2 players."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie"],
-            starting_stack=100,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(THREE_PLAYERS, starting_stack=100)
 
         # All but one player eliminated
-        env._current_stacks = [300.0, 0.0, 0.0]
-
         with pytest.raises(ValueError, match="Not enough active players"):
-            env.start_hand()
+            env.reset([300.0, 0.0, 0.0])
 
 
 class TestEdgeCases:
     """Edge cases and potential failure modes."""
 
-    def test_first_player_eliminated(self):
-        """First player (seat 0) eliminated should work correctly."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie"],
-            starting_stack=100,
-            small_blind=10,
-            big_blind=20,
-        )
-
-        env._current_stacks = [0.0, 150.0, 150.0]
-        env.start_hand()
-
-        assert env._active_original_seats == [1, 2]
-        assert env._original_to_pokerkit_seat(0) is None
-        assert env._original_to_pokerkit_seat(1) == 0
-        assert env._original_to_pokerkit_seat(2) == 1
-
-    def test_last_player_eliminated(self):
-        """Last player (highest seat) eliminated should work correctly."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie"],
-            starting_stack=100,
-            small_blind=10,
-            big_blind=20,
-        )
-
-        env._current_stacks = [150.0, 150.0, 0.0]
-        env.start_hand()
-
-        assert env._active_original_seats == [0, 1]
-        assert env._original_to_pokerkit_seat(0) == 0
-        assert env._original_to_pokerkit_seat(1) == 1
-        assert env._original_to_pokerkit_seat(2) is None
-
-    def test_alternating_eliminations(self):
-        """Alternating seats eliminated (0, 2, 4) should work."""
-        env = PokerEnvironment(
-            player_names=["a", "b", "c", "d", "e"],
-            starting_stack=100,
-            small_blind=10,
-            big_blind=20,
-        )
-
-        # Eliminate seats 0, 2, 4
-        env._current_stacks = [0.0, 200.0, 0.0, 200.0, 0.0]
-        env.start_hand()
-
-        assert env._active_original_seats == [1, 3]
-        assert env._pokerkit_to_original_seat(0) == 1
-        assert env._pokerkit_to_original_seat(1) == 3
-
-    def test_action_history_uses_original_indices(self):
+    def test_action_history_uses_original_indices(self, env_factory):
         """Action history should record original player indices."""
-        env = PokerEnvironment(
-            player_names=["alice", "bob", "charlie", "diana"],
-            starting_stack=100,
-            small_blind=10,
-            big_blind=20,
-        )
+        env = env_factory(["alice", "bob", "charlie", "diana"], starting_stack=100)
 
         # Eliminate bob (seat 1)
-        env._current_stacks = [100.0, 0.0, 100.0, 100.0]
-        env.start_hand()
+        env.reset([100.0, 0.0, 100.0, 100.0])
 
         # Execute some actions
         while not env.is_hand_complete():
@@ -5,12 +5,16 @@ These tests verify that equity calculations and EV tracking work correctly
 for various poker scenarios. No LLM calls required - pure computation tests.
 """
 
+import pytest
+
+from backend.domain.game import equity as equity_module
 from backend.domain.game.equity import (
     calculate_all_in_ev,
     calculate_multiway_equity,
     calculate_showdown_equity,
     cards_to_pokerkit,
 )
+from backend.domain.game.hand_evaluator import card_indices
 from backend.domain.game.models import Card, EVRecord
 
 
@@ -47,49 +51,36 @@ class TestCardsToPokerkit:
 class TestShowdownEquity:
     """Test equity calculations at showdown with known hands."""
 
-    def test_pocket_aces_vs_pocket_kings_preflop(self):
-        """AA vs KK preflop - AA should have ~82% equity."""
-        hero = make_cards(["As", "Ah"])
-        villain = make_cards(["Ks", "Kh"])
-        board = []
-
-        equity = calculate_showdown_equity(hero, villain, board)
-
-        # AA vs KK is roughly 82% for AA
-        assert 0.78 < equity < 0.86, f"AA vs KK equity should be ~82%, got {equity * 100:.1f}%"
-
-    def test_pocket_pair_vs_overcards_preflop(self):
-        """77 vs AK preflop - classic coin flip, 77 has ~53% equity."""
-        hero = make_cards(["7s", "7h"])
-        villain = make_cards(["Ac", "Kd"])
-        board = []
-
-        equity = calculate_showdown_equity(hero, villain, board)
-
-        # 77 vs AK is roughly 53% for 77
-        assert 0.48 < equity < 0.58, f"77 vs AK equity should be ~53%, got {equity * 100:.1f}%"
-
-    def test_set_vs_top_pair_on_flop(self):
-        """Set vs top pair on flop - set should have ~90%+ equity."""
-        hero = make_cards(["7d", "7c"])  # Set of 7s
-        villain = make_cards(["Kc", "8s"])  # Top pair
-        board = make_cards(["3s", "7s", "8d"])  # 7 on flop
-
-        equity = calculate_showdown_equity(hero, villain, board)
-
-        # Set vs top pair is usually 85-95%
-        assert equity > 0.85, f"Set vs top pair should be 85%+, got {equity * 100:.1f}%"
-
-    def test_flush_draw_with_overcards_vs_pair_on_flop(self):
-        """Flush draw + overcards vs made pair on flop - combo draw has ~50-55% equity."""
-        hero = make_cards(["Qs", "Js"])  # Flush draw + two overcards
-        villain = make_cards(["Ah", "8c"])  # Pair of 8s
-        board = make_cards(["8s", "5s", "2d"])
-
-        equity = calculate_showdown_equity(hero, villain, board)
-
-        # QsJs has flush draw (9 outs) + overcard outs = combo draw ~50-55%
-        assert 0.45 < equity < 0.60, f"Combo draw equity should be ~50-55%, got {equity * 100:.1f}%"
+    @pytest.mark.parametrize(
+        "hero,villain,board,low,high",
+        [
+            # AA vs KK is roughly 82% for AA
+            (["As", "Ah"], ["Ks", "Kh"], [], 0.78, 0.86),
+            # 77 vs AK - classic coin flip, roughly 53% for 77
+            (["7s", "7h"], ["Ac", "Kd"], [], 0.48, 0.58),
+            # AK vs A7 - AK dominates with roughly 72%
+            (["Ac", "Kd"], ["Ah", "7s"], [], 0.68, 0.78),
+            # Set of 7s vs top pair is usually 85-95%
+            (["7d", "7c"], ["Kc", "8s"], ["3s", "7s", "8d"], 0.85, 1.0),
+            # QsJs flush draw (9 outs) + two overcards vs a pair of 8s is ~50-55%
+            (["Qs", "Js"], ["Ah", "8c"], ["8s", "5s", "2d"], 0.45, 0.60),
+        ],
+        ids=[
+            "aces_vs_kings_preflop",
+            "pocket_pair_vs_overcards_preflop",
+            "dominated_ace_preflop",
+            "set_vs_top_pair_on_flop",
+            "flush_draw_with_overcards_vs_pair_on_flop",
+        ],
+    )
+    def test_equity_range(self, hero, villain, board, low, high):
+        """Known matchups land in their expected equity range."""
+        equity = calculate_showdown_equity(make_cards(hero), make_cards(villain), make_cards(board))
+
+        assert low < equity < high, (
+            f"{hero} vs {villain} on {board} should be {low:.0%}-{high:.0%}, "
+            f"got {equity * 100:.1f}%"
+        )
 
     def test_rivered_flush_wins(self):
         """Flush on river beats two pair - deterministic 100% equity."""
@@ -124,17 +115,6 @@ class TestShowdownEquity:
         # Both play the board (AAA-KK) - chop
         assert equity == 0.5, f"Chopped pot should be 50%, got {equity * 100:.1f}%"
 
-    def test_dominated_ace_preflop(self):
-        """AK vs A7 - AK dominates with ~72% equity."""
-        hero = make_cards(["Ac", "Kd"])
-        villain = make_cards(["Ah", "7s"])
-        board = []
-
-        equity = calculate_showdown_equity(hero, villain, board)
-
-        # AK vs A7 is roughly 72% for AK
-        assert 0.68 < equity < 0.78, f"AK vs A7 should be ~72%, got {equity * 100:.1f}%"
-
 
 class TestEVRecord:
     """Test the EVRecord dataclass and calculations."""
@@ -406,6 +386,75 @@ class TestEdgeCases:
             f"Flush draw vs trips should be 15-35%, got {equity * 100:.1f}%"
         )
 
+    def test_turn_equity_is_exact(self):
+        """With one card to come every river is enumerated, so equity is an exact fraction."""
+        hero = make_cards(["Ah", "Kh"])
+        villain = make_cards(["Jd", "Jc"])
+        board = make_cards(["2h", "7s", "Jh", "3c"])
+
+        equity = calculate_showdown_equity(hero, villain, board)
+
+        # 9 hearts left, but 3h and 7h pair the board and give villain a full house
+        assert equity == 7 / 44
+
+    def test_flop_equity_is_deterministic(self):
+        """Two cards to come are enumerated too, so repeated calls agree exactly."""
+        hero = make_cards(["Ah", "Kh"])
+        villain = make_cards(["Qs", "Qd"])
+        board = make_cards(["2h", "7h", "Jc"])
+
+        first = calculate_showdown_equity(hero, villain, board)
+
+        assert calculate_showdown_equity(hero, villain, board) == first
+
+    def test_suit_isomorphic_deals_share_equity(self):
+        """Relabeling suits does not change equity, so both deals hit the same cache entry."""
+        spades_hearts = calculate_showdown_equity(
+            make_cards(["As", "Ah"]), make_cards(["Ks", "Kh"]), []
+        )
+        clubs_diamonds = calculate_showdown_equity(
+            make_cards(["Ad", "Ac"]), make_cards(["Kd", "Kc"]), []
+        )
+
+        assert spades_hearts == clubs_diamonds
+
+    def test_monte_carlo_stops_early_on_lopsided_deal(self, monkeypatch):
+        """Sampling stops after one batch once the confidence interval is tight enough."""
+        runouts = []
+        pot_share = equity_module._pot_share
+
+        def counting_pot_share(hands, runout):
+            runouts.append(runout)
+            return pot_share(hands, runout)
+
+        monkeypatch.setattr(equity_module, "_pot_share", counting_pot_share)
+        hero = card_indices(make_cards(["As", "Ah"]))
+        villain = card_indices(make_cards(["2c", "3d"]))
+
+        # AA vs 23o is ~87%, so one batch already gives a 95% half-width well under 10%
+        equity = equity_module._calculate_multiway_monte_carlo(hero, [villain], [], 10000, 0.1)
+
+        assert len(runouts) == equity_module.MC_BATCH_SIZE
+        assert equity > 0.8
+
+    def test_monte_carlo_does_not_stop_on_unanimous_batch(self, monkeypatch):
+        """A batch of identical outcomes has zero sample variance but is not yet conclusive."""
+        runouts = []
+
+        def always_win(hands, runout):
+            runouts.append(runout)
+            return 1.0
+
+        monkeypatch.setattr(equity_module, "_pot_share", always_win)
+        hero = card_indices(make_cards(["As", "Ah"]))
+        villain = card_indices(make_cards(["2c", "3d"]))
+
+        equity = equity_module._calculate_multiway_monte_carlo(hero, [villain], [], 10000, 0.005)
+
+        # 256/256 wins is still consistent with ~98.5% equity, wider than the target
+        assert equity_module.MC_BATCH_SIZE < len(runouts) < 10000
+        assert equity == 1.0
+
     def test_multiway_with_empty_board(self):
         """3-way preflop all-in with no board cards."""
         hero = make_cards(["Ah", "Ac"])
@@ -0,0 +1,77 @@
+"""
+Tests for saving and loading experiment result files.
+"""
+
+import pytest
+
+import backend.main as main_module
+from backend.main import read_experiment_results, save_experiment_results
+
+
+def make_results() -> dict:
+    """Create a minimal experiment results dict."""
+    return {
+        "tournaments_run": 2,
+        "agent_d_wins": 1,
+        "agent_d_win_rate": 0.5,
+        "agent_d_avg_placement": 1.5,
+        "agent_d_placements": [1, 2],
+        "agent_e_wins": 1,
+        "agent_e_win_rate": 0.5,
+        "agent_e_avg_placement": 1.5,
+        "agent_e_placements": [2, 1],
+        "all_placements": {"agent_d": [1, 1], "agent_e": [1, 1]},
+        "ev_by_player": {"agent_d": {"ev_chips": 120.5, "showdown_count": 3}},
+    }
+
+
+class TestExperimentResultsRoundTrip:
+    """Results written by save_experiment_results read back unchanged."""
+
+    @pytest.mark.parametrize("compact", [False, True], ids=["indented", "compact"])
+    def test_json_round_trip(self, tmp_path, compact):
+        """JSON results load back with the saved values."""
+        path = save_experiment_results(
+            make_results(), output_dir=str(tmp_path), include_logs=False, compact=compact
+        )
+
+        assert path.endswith(".json")
+        loaded = read_experiment_results(path)
+        assert loaded["tournaments_run"] == 2
+        assert loaded["agent_d"]["placements"] == [1, 2]
+        assert loaded["agent_d"]["ev_chips"] == 120.5
+        assert loaded["agent_e"]["showdown_count"] == 0
+        assert loaded["all_placements"] == {"agent_d": [1, 1], "agent_e": [1, 1]}
+
+    def test_msgpack_round_trip(self, tmp_path):
+        """msgpack results load back the same as the JSON export."""
+        pytest.importorskip("msgpack")
+        json_path = save_experiment_results(
+            make_results(), output_dir=str(tmp_path), include_logs=False
+        )
+        msgpack_path = save_experiment_results(
+            make_results(), output_dir=str(tmp_path), include_logs=False, output_format="msgpack"
+        )
+
+        assert msgpack_path.endswith(".msgpack")
+        assert read_experiment_results(msgpack_path) == read_experiment_results(json_path)
+
+
+class TestFormatOption:
+    """The --format option is checked before any tournament runs."""
+
+    def test_msgpack_without_extra_exits_early(self, monkeypatch, capsys):
+        """--format msgpack without msgpack installed is a usage error."""
+        real_find_spec = main_module.importlib.util.find_spec
+        monkeypatch.setattr(
+            main_module.importlib.util,
+            "find_spec",
+            lambda name, *args: None if name == "msgpack" else real_find_spec(name, *args),
+        )
+        monkeypatch.setattr(main_module.sys, "argv", ["main", "--format", "msgpack"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            main_module.main()
+
+        assert exc_info.value.code == 2
+        assert "msgpack" in capsys.readouterr().err
@@ -4,14 +4,14 @@ Tests for file locking utilities.
 These tests verify that file locking works correctly to prevent
 race conditions when multiple processes access shared files.
 
-Note: fcntl locks work at the process level, not thread level.
+Note: each lock holder flocks its own descriptor, so threads in one
+process exclude each other the same way separate processes do.
 Cross-process locking is the main use case and is tested manually
 by running multiple tournament processes.
 """
 
 import os
-import tempfile
-from pathlib import Path
+import threading
 
 from backend.domain.utils.file_lock import file_lock, stats_file_lock
 
@@ -19,110 +19,192 @@ from backend.domain.utils.file_lock import file_lock, stats_file_lock
 class TestFileLock:
     """Test the file_lock context manager."""
 
-    def test_lock_creates_lock_file(self):
+    def test_lock_creates_lock_file(self, tmp_path):
         """Lock file should be created next to the target file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            target = os.path.join(tmpdir, "test.json")
-            lock_path = target + ".lock"
+        target = tmp_path / "test.json"
+        lock_path = target.with_name(target.name + ".lock")
 
-            # Lock file shouldn't exist yet
-            assert not os.path.exists(lock_path)
+        # Lock file shouldn't exist yet
+        assert not lock_path.exists()
 
-            with file_lock(target):
-                # Lock file should exist during lock
-                assert os.path.exists(lock_path)
+        with file_lock(target):
+            # Lock file should exist during lock
+            assert lock_path.exists()
 
-    def test_can_acquire_and_release_lock(self):
+    def test_can_acquire_and_release_lock(self, tmp_path):
         """Basic lock acquire and release should work."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            target = os.path.join(tmpdir, "test.json")
+        target = tmp_path / "test.json"
 
-            # First acquisition
-            with file_lock(target, exclusive=True):
-                Path(target).write_text('{"test": 1}')
+        # First acquisition
+        with file_lock(target, exclusive=True):
+            target.write_text('{"test": 1}')
 
-            # Should be able to acquire again after release
-            with file_lock(target, exclusive=True):
-                data = Path(target).read_text()
-                assert data == '{"test": 1}'
+        # Should be able to acquire again after release
+        with file_lock(target, exclusive=True):
+            data = target.read_text()
+            assert data == '{"test": 1}'
 
-    def test_shared_lock_allows_read(self):
+    def test_shared_lock_allows_read(self, tmp_path):
         """Shared lock should allow reading."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            target = os.path.join(tmpdir, "test.json")
-            Path(target).write_text('{"data": "value"}')
+        target = tmp_path / "test.json"
+        target.write_text('{"data": "value"}')
 
-            with file_lock(target, exclusive=False):
-                data = Path(target).read_text()
-                assert "data" in data
+        with file_lock(target, exclusive=False):
+            data = target.read_text()
+            assert "data" in data
 
 
 class TestStatsFileLock:
     """Test the stats_file_lock convenience wrapper."""
 
-    def test_stats_lock_exclusive(self):
+    def test_stats_lock_exclusive(self, tmp_path):
         """stats_file_lock with exclusive=True should block other exclusive locks."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            stats_path = os.path.join(tmpdir, "stats.json")
+        stats_path = tmp_path / "stats.json"
 
-            # Write some test data
-            Path(stats_path).write_text("{}")
+        # Write some test data
+        stats_path.write_text("{}")
 
-            with stats_file_lock(stats_path, exclusive=True):
-                # Should be able to read/write while holding lock
-                data = Path(stats_path).read_text()
-                assert data == "{}"
+        with stats_file_lock(stats_path, exclusive=True):
+            # Should be able to read/write while holding lock
+            data = stats_path.read_text()
+            assert data == "{}"
 
-    def test_stats_lock_shared(self):
+    def test_stats_lock_shared(self, tmp_path):
         """stats_file_lock with exclusive=False should allow concurrent reads."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            stats_path = os.path.join(tmpdir, "stats.json")
-            Path(stats_path).write_text('{"test": true}')
+        stats_path = tmp_path / "stats.json"
+        stats_path.write_text('{"test": true}')
 
-            with stats_file_lock(stats_path, exclusive=False):
-                data = Path(stats_path).read_text()
-                assert "test" in data
+        with stats_file_lock(stats_path, exclusive=False):
+            data = stats_path.read_text()
+            assert "test" in data
 
 
 class TestLockEdgeCases:
     """Edge cases and error handling."""
 
-    def test_lock_on_nonexistent_file(self):
+    def test_lock_on_nonexistent_file(self, tmp_path):
         """Should be able to lock a file that doesn't exist yet."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            target = os.path.join(tmpdir, "nonexistent.json")
+        target = tmp_path / "nonexistent.json"
 
-            # File doesn't exist
-            assert not os.path.exists(target)
+        # File doesn't exist
+        assert not target.exists()
 
-            # But we can still lock it
-            with file_lock(target):
-                # Lock acquired successfully
-                pass
+        # But we can still lock it
+        with file_lock(target):
+            # Lock acquired successfully
+            pass
 
-    def test_lock_creates_parent_directories(self):
+    def test_lock_creates_parent_directories(self, tmp_path):
         """Lock should create parent directories if they don't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            target = os.path.join(tmpdir, "subdir", "nested", "test.json")
+        target = tmp_path / "subdir" / "nested" / "test.json"
 
-            # Parent dirs don't exist
-            assert not os.path.exists(os.path.dirname(target))
+        # Parent dirs don't exist
+        assert not target.parent.exists()
 
-            with file_lock(target):
-                # Parent dirs should be created for lock file
-                assert os.path.exists(os.path.dirname(target))
+        with file_lock(target):
+            # Parent dirs should be created for lock file
+            assert target.parent.exists()
 
-    def test_lock_released_on_exception(self):
+    def test_lock_released_on_exception(self, tmp_path):
         """Lock should be released even if an exception occurs."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            target = os.path.join(tmpdir, "test.json")
+        target = tmp_path / "test.json"
+
+        try:
+            with file_lock(target):
+                raise ValueError("Test exception")
+        except ValueError:
+            pass
+
+        # Should be able to acquire lock again (it was released)
+        with file_lock(target):
+            pass  # No deadlock
+
+    def test_lock_file_recreated_after_delete(self, tmp_path):
+        """A deleted lock file should be recreated instead of locking the stale one."""
+        target = tmp_path / "test.json"
+        lock_path = target.with_name(target.name + ".lock")
+
+        with file_lock(target):
+            pass
+        lock_path.unlink()
+
+        with file_lock(target):
+            assert lock_path.exists()
+
+
+class TestLockConcurrency:
+    """Locks taken from several threads, or nested, in one process."""
 
+    def test_shared_locks_overlap_across_threads(self, tmp_path):
+        """Two threads should hold shared locks on the same file at once."""
+        target = tmp_path / "test.json"
+        both_inside = threading.Barrier(2, timeout=5)
+        errors: list[BaseException] = []
+
+        def read() -> None:
             try:
-                with file_lock(target):
-                    raise ValueError("Test exception")
-            except ValueError:
+                with file_lock(target, exclusive=False):
+                    # Only passes if the other reader is inside its lock too
+                    both_inside.wait()
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert not errors
+
+    def test_exclusive_lock_blocks_other_thread(self, tmp_path):
+        """An exclusive lock held by one thread should block another thread."""
+        target = tmp_path / "test.json"
+        acquired = threading.Event()
+
+        def write() -> None:
+            with file_lock(target, exclusive=True):
+                acquired.set()
+
+        with file_lock(target, exclusive=True):
+            thread = threading.Thread(target=write)
+            thread.start()
+            assert not acquired.wait(timeout=0.2)
+
+        thread.join(timeout=5)
+        assert acquired.is_set()
+
+    def test_nested_shared_locks(self, tmp_path):
+        """A shared lock nested in another on the same path should not deadlock."""
+        target = tmp_path / "test.json"
+        done = threading.Event()
+
+        def nested_read() -> None:
+            with file_lock(target, exclusive=False):
+                with file_lock(target, exclusive=False):
+                    pass
+            done.set()
+
+        thread = threading.Thread(target=nested_read, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+
+        assert done.is_set()
+
+    def test_lock_file_descriptor_reused(self, tmp_path, monkeypatch):
+        """Repeated locks on one path should open the lock file only once."""
+        target = tmp_path / "test.json"
+        opened: list[str] = []
+        real_open = os.open
+
+        def counting_open(path, *args, **kwargs):
+            opened.append(str(path))
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(os, "open", counting_open)
+
+        for exclusive in (True, False, True):
+            with file_lock(target, exclusive=exclusive):
                 pass
 
-            # Should be able to acquire lock again (it was released)
-            with file_lock(target):
-                pass  # No deadlock
+        assert opened == [str(target) + ".lock"]
@@ -0,0 +1,119 @@
+"""
+Tests for the integer hand evaluator used by the equity calculations.
+
+Hand ranking is checked directly for every category and cross-checked
+against PokerKit's StandardHighHand on random showdowns.
+"""
+
+import random
+
+import pytest
+from pokerkit import Card as PKCard
+from pokerkit import StandardHighHand
+
+from backend.domain.game.hand_evaluator import (
+    FLUSH,
+    FOUR_OF_A_KIND,
+    FULL_HOUSE,
+    HIGH_CARD,
+    PAIR,
+    RANKS,
+    STRAIGHT,
+    STRAIGHT_FLUSH,
+    SUITS,
+    THREE_OF_A_KIND,
+    TWO_PAIR,
+    card_index,
+    card_indices,
+    evaluate_hand,
+)
+from backend.domain.game.models import Card
+
+
+def score(cards: str) -> int:
+    """Score a space-separated hand like 'As Kd 7c 7h 2s 3d 9c'."""
+    return evaluate_hand(card_indices(Card.from_string(s) for s in cards.split()))
+
+
+class TestCardIndex:
+    """Test the 0-51 card encoding."""
+
+    def test_indices_cover_the_deck(self):
+        """Every rank/suit pair maps to a distinct index in 0-51."""
+        indices = {card_index(Card(rank=r, suit=s)) for r in RANKS for s in SUITS}
+        assert indices == set(range(52))
+
+    def test_invalid_card_raises(self):
+        """Unknown ranks or suits raise ValueError."""
+        with pytest.raises(ValueError):
+            card_index(Card(rank="1", suit="x"))
+
+
+class TestHandCategories:
+    """Test that each category is recognized and ordered correctly."""
+
+    @pytest.mark.parametrize(
+        "cards,category",
+        [
+            ("As Kd 9c 7h 5s 3d 2c", HIGH_CARD),
+            ("As Ad 9c 7h 5s 3d 2c", PAIR),
+            ("As Ad 9c 9h 5s 3d 2c", TWO_PAIR),
+            ("As Ad Ac 9h 5s 3d 2c", THREE_OF_A_KIND),
+            ("As 2d 3c 4h 5s 9d Kc", STRAIGHT),
+            ("As Ks 9s 7s 2s 3d 2c", FLUSH),
+            ("As Ad Ac 9h 9s 3d 2c", FULL_HOUSE),
+            ("As Ad Ac 9h 9s 9d 2c", FULL_HOUSE),
+            ("As Ad Ac Ah 9s 3d 2c", FOUR_OF_A_KIND),
+            ("5h 6h 7h 8h 9h Ad Ac", STRAIGHT_FLUSH),
+        ],
+        ids=[
+            "high_card",
+            "pair",
+            "two_pair",
+            "trips",
+            "wheel",
+            "flush",
+            "full_house",
+            "two_trips",
+            "quads",
+            "straight_flush",
+        ],
+    )
+    def test_category(self, cards, category):
+        """The category is stored above the packed kicker ranks."""
+        assert score(cards) >> 20 == category
+
+    def test_kicker_decides_pair(self):
+        """Same pair, better kicker wins."""
+        assert score("As Ad Kc 7h 5s 3d 2c") > score("As Ad Qc 7h 5s 3d 2c")
+
+    def test_counterfeited_two_pair_plays_board(self):
+        """Three pairs play the top two with the best kicker."""
+        assert score("Ks Kd Qc Qh 2s 2d Ac") == score("Ks Kd Qc Qh 3s 3d Ac")
+
+    def test_wheel_loses_to_six_high_straight(self):
+        """A-2-3-4-5 is the lowest straight."""
+        assert score("As 2d 3c 4h 5s 9d Kc") < score("6s 2d 3c 4h 5s 9d Kc")
+
+
+class TestAgreesWithPokerKit:
+    """Cross-check showdown results against PokerKit's evaluator."""
+
+    def test_random_showdowns(self):
+        """Random heads-up river showdowns rank the same way as PokerKit."""
+        deck = [f"{r}{s}" for r in RANKS for s in SUITS]
+        rng = random.Random(7)
+        for _ in range(300):
+            dealt = rng.sample(deck, 9)
+            hero, villain, board = dealt[:2], dealt[2:4], dealt[4:]
+
+            ours = score(" ".join(hero + board)) - score(" ".join(villain + board))
+            theirs_hero = StandardHighHand.from_game(
+                PKCard.parse("".join(hero)), PKCard.parse("".join(board))
+            )
+            theirs_villain = StandardHighHand.from_game(
+                PKCard.parse("".join(villain)), PKCard.parse("".join(board))
+            )
+            expected = (theirs_hero > theirs_villain) - (theirs_hero < theirs_villain)
+
+            assert (ours > 0) - (ours < 0) == expected, f"{hero} vs {villain} on {board}"
@@ -11,7 +11,9 @@ No LLM calls required - pure data/computation tests.
 """
 
 import json
-import tempfile
+import os
+from collections.abc import Sequence
+from dataclasses import fields
 from pathlib import Path
 
 from backend.domain.game.models import (
@@ -28,28 +30,31 @@ from backend.domain.game.recorder import (
     MinimalAction,
     TournamentRecord,
 )
-from backend.domain.player.recalculator import recalculate_baseline_stats
+from backend.domain.player.recalculator import is_stats_file_fresh, recalculate_baseline_stats
 
 # =============================================================================
 # Test Fixtures and Helpers
 # =============================================================================
 
+# Three-handed table used by make_game_state when no players are given
+DEFAULT_PLAYERS = (
+    {"name": "player_a", "stack": 1490.0, "seat": 0},
+    {"name": "player_b", "stack": 1480.0, "seat": 1},
+    {"name": "player_c", "stack": 1500.0, "seat": 2},
+)
+
 
 def make_game_state(
     hand_number: int = 1,
     street: Street = Street.PREFLOP,
     pot: float = 30.0,
     current_bet: float = 20.0,
-    players: list[dict] | None = None,
+    players: Sequence[dict] | None = None,
     action_history: list[dict] | None = None,
 ) -> StructuredGameState:
     """Create a minimal game state for testing."""
     if players is None:
-        players = [
-            {"name": "player_a", "stack": 1490.0, "seat": 0},
-            {"name": "player_b", "stack": 1480.0, "seat": 1},
-            {"name": "player_c", "stack": 1500.0, "seat": 2},
-        ]
+        players = DEFAULT_PLAYERS
 
     player_states = [
         PlayerState(
@@ -211,35 +216,45 @@ class TestGameStateRecorder:
         assert hand.ev_records[0].player_id == "player_a"
         assert hand.ev_records[0].equity == 0.75
 
-    def test_save_and_load_tournament(self):
+    def test_save_and_load_tournament(self, tmp_path):
         """Verify tournament can be saved and loaded correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            recorder = GameStateRecorder(gamestates_dir=tmpdir)
-            recorder.start_tournament("round_trip_test")
-
-            # Record some actions
-            state = make_game_state(hand_number=1)
-            recorder.record_action(state, "player_a", Action(type=ActionType.RAISE, amount=60.0))
-            recorder.record_action(state, "player_b", Action(type=ActionType.CALL, amount=60.0))
-            recorder.record_hand_result(
-                {"player_a": 1560.0, "player_b": 1440.0, "player_c": 1500.0}
-            )
+        recorder = GameStateRecorder(gamestates_dir=str(tmp_path))
+        recorder.start_tournament("round_trip_test")
+
+        # Record some actions
+        state = make_game_state(hand_number=1)
+        recorder.record_action(state, "player_a", Action(type=ActionType.RAISE, amount=60.0))
+        recorder.record_action(state, "player_b", Action(type=ActionType.CALL, amount=60.0))
+        recorder.record_hand_result({"player_a": 1560.0, "player_b": 1440.0, "player_c": 1500.0})
+
+        # Add EV record
+        ev_record = make_ev_record(5, "player_a", 0.80, 200.0, 100.0, won=True)
+        recorder._current_hand.ev_records.append(ev_record)
+
+        # Save
+        filepath = recorder.save_tournament()
+        assert filepath is not None
+        assert Path(filepath).exists()
+
+        # Load and verify
+        loaded = GameStateRecorder.load_tournament(filepath)
+        assert loaded.tournament_id == "round_trip_test"
+        assert len(loaded.hands) == 1
+        assert len(loaded.hands[0].actions) == 2
+        assert loaded.hands[0].finishing_stacks["player_a"] == 1560.0
 
-            # Add EV record
-            ev_record = make_ev_record(5, "player_a", 0.80, 200.0, 100.0, won=True)
-            recorder._current_hand.ev_records.append(ev_record)
+    def test_tournament_files_filters_and_sorts(self, tmp_path):
+        """Only tournament_*.json files are listed, in name order."""
+        (tmp_path / "tournament_b.json").write_text("{}")
+        (tmp_path / "tournament_a.json").write_text("{}")
+        (tmp_path / "tournament_c.json.tmp").write_text("{}")
+        (tmp_path / "notes.json").write_text("{}")
+        (tmp_path / "tournament_dir.json").mkdir()
 
-            # Save
-            filepath = recorder.save_tournament()
-            assert filepath is not None
-            assert Path(filepath).exists()
+        files = GameStateRecorder.tournament_files(str(tmp_path))
 
-            # Load and verify
-            loaded = GameStateRecorder.load_tournament(filepath)
-            assert loaded.tournament_id == "round_trip_test"
-            assert len(loaded.hands) == 1
-            assert len(loaded.hands[0].actions) == 2
-            assert loaded.hands[0].finishing_stacks["player_a"] == 1560.0
+        assert [entry.name for entry in files] == ["tournament_a.json", "tournament_b.json"]
+        assert GameStateRecorder.tournament_files(str(tmp_path / "missing")) == []
 
 
 # =============================================================================
@@ -510,286 +525,369 @@ class TestTournamentRecord:
 class TestStatisticsRecalculation:
     """Tests for statistics recalculation from saved game states."""
 
-    def test_recalculate_from_single_tournament(self):
+    def test_recalculate_from_single_tournament(self, tmp_path):
         """Test recalculating stats from a single tournament file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a tournament with known statistics
-            gamestates_dir = Path(tmpdir) / "gamestates"
-            gamestates_dir.mkdir()
-
-            tournament_data = {
-                "tournament_id": "stats_test",
-                "timestamp": "20251213_120000",
-                "format_version": 3,
-                "players": ["player_a", "player_b", "player_c"],
-                "hands": [
-                    {
-                        "hand_number": 1,
-                        "small_blind": 10.0,
-                        "big_blind": 20.0,
-                        "starting_stacks": {
-                            "player_a": 1490.0,
-                            "player_b": 1480.0,
-                            "player_c": 1500.0,
-                        },
-                        "finishing_stacks": {
-                            "player_a": 1550.0,
-                            "player_b": 1450.0,
-                            "player_c": 1500.0,
-                        },
-                        "actions": [
-                            # player_a raises (PFR)
-                            {
-                                "street": "preflop",
-                                "actor": "player_a",
-                                "action_type": "raise",
-                                "amount": 60.0,
-                                "pot": 30.0,
-                                "current_bet": 20.0,
-                                "preflop_raise_count": 0,
-                                "stacks": {
-                                    "player_a": 1490.0,
-                                    "player_b": 1480.0,
-                                    "player_c": 1500.0,
-                                },
-                            },
-                            # player_b calls (VPIP, no PFR)
-                            {
-                                "street": "preflop",
-                                "actor": "player_b",
-                                "action_type": "call",
-                                "amount": 60.0,
-                                "pot": 90.0,
-                                "current_bet": 60.0,
-                                "preflop_raise_count": 1,
-                                "stacks": {
-                                    "player_a": 1430.0,
-                                    "player_b": 1480.0,
-                                    "player_c": 1500.0,
-                                },
+        # Create a tournament with known statistics
+        gamestates_dir = tmp_path / "gamestates"
+        gamestates_dir.mkdir()
+
+        tournament_data = {
+            "tournament_id": "stats_test",
+            "timestamp": "20251213_120000",
+            "format_version": 3,
+            "players": ["player_a", "player_b", "player_c"],
+            "hands": [
+                {
+                    "hand_number": 1,
+                    "small_blind": 10.0,
+                    "big_blind": 20.0,
+                    "starting_stacks": {
+                        "player_a": 1490.0,
+                        "player_b": 1480.0,
+                        "player_c": 1500.0,
+                    },
+                    "finishing_stacks": {
+                        "player_a": 1550.0,
+                        "player_b": 1450.0,
+                        "player_c": 1500.0,
+                    },
+                    "actions": [
+                        # player_a raises (PFR)
+                        {
+                            "street": "preflop",
+                            "actor": "player_a",
+                            "action_type": "raise",
+                            "amount": 60.0,
+                            "pot": 30.0,
+                            "current_bet": 20.0,
+                            "preflop_raise_count": 0,
+                            "stacks": {
+                                "player_a": 1490.0,
+                                "player_b": 1480.0,
+                                "player_c": 1500.0,
                             },
-                            # player_c folds (no VPIP)
-                            {
-                                "street": "preflop",
-                                "actor": "player_c",
-                                "action_type": "fold",
-                                "amount": None,
-                                "pot": 140.0,
-                                "current_bet": 60.0,
-                                "preflop_raise_count": 1,
-                                "stacks": {
-                                    "player_a": 1430.0,
-                                    "player_b": 1420.0,
-                                    "player_c": 1500.0,
-                                },
+                        },
+                        # player_b calls (VPIP, no PFR)
+                        {
+                            "street": "preflop",
+                            "actor": "player_b",
+                            "action_type": "call",
+                            "amount": 60.0,
+                            "pot": 90.0,
+                            "current_bet": 60.0,
+                            "preflop_raise_count": 1,
+                            "stacks": {
+                                "player_a": 1430.0,
+                                "player_b": 1480.0,
+                                "player_c": 1500.0,
                             },
-                        ],
-                    },
-                    {
-                        "hand_number": 2,
-                        "small_blind": 10.0,
-                        "big_blind": 20.0,
-                        "starting_stacks": {
-                            "player_a": 1540.0,
-                            "player_b": 1430.0,
-                            "player_c": 1500.0,
                         },
-                        "finishing_stacks": {
-                            "player_a": 1540.0,
-                            "player_b": 1460.0,
-                            "player_c": 1500.0,
+                        # player_c folds (no VPIP)
+                        {
+                            "street": "preflop",
+                            "actor": "player_c",
+                            "action_type": "fold",
+                            "amount": None,
+                            "pot": 140.0,
+                            "current_bet": 60.0,
+                            "preflop_raise_count": 1,
+                            "stacks": {
+                                "player_a": 1430.0,
+                                "player_b": 1420.0,
+                                "player_c": 1500.0,
+                            },
                         },
-                        "actions": [
-                            # player_a folds (no VPIP)
-                            {
-                                "street": "preflop",
-                                "actor": "player_a",
-                                "action_type": "fold",
-                                "amount": None,
-                                "pot": 30.0,
-                                "current_bet": 20.0,
-                                "preflop_raise_count": 0,
-                                "stacks": {
-                                    "player_a": 1540.0,
-                                    "player_b": 1430.0,
-                                    "player_c": 1500.0,
-                                },
+                    ],
+                },
+                {
+                    "hand_number": 2,
+                    "small_blind": 10.0,
+                    "big_blind": 20.0,
+                    "starting_stacks": {
+                        "player_a": 1540.0,
+                        "player_b": 1430.0,
+                        "player_c": 1500.0,
+                    },
+                    "finishing_stacks": {
+                        "player_a": 1540.0,
+                        "player_b": 1460.0,
+                        "player_c": 1500.0,
+                    },
+                    "actions": [
+                        # player_a folds (no VPIP)
+                        {
+                            "street": "preflop",
+                            "actor": "player_a",
+                            "action_type": "fold",
+                            "amount": None,
+                            "pot": 30.0,
+                            "current_bet": 20.0,
+                            "preflop_raise_count": 0,
+                            "stacks": {
+                                "player_a": 1540.0,
+                                "player_b": 1430.0,
+                                "player_c": 1500.0,
                             },
-                            # player_b raises (VPIP + PFR)
-                            {
-                                "street": "preflop",
-                                "actor": "player_b",
-                                "action_type": "raise",
-                                "amount": 60.0,
-                                "pot": 30.0,
-                                "current_bet": 20.0,
-                                "preflop_raise_count": 0,
-                                "stacks": {
-                                    "player_a": 1540.0,
-                                    "player_b": 1430.0,
-                                    "player_c": 1500.0,
-                                },
+                        },
+                        # player_b raises (VPIP + PFR)
+                        {
+                            "street": "preflop",
+                            "actor": "player_b",
+                            "action_type": "raise",
+                            "amount": 60.0,
+                            "pot": 30.0,
+                            "current_bet": 20.0,
+                            "preflop_raise_count": 0,
+                            "stacks": {
+                                "player_a": 1540.0,
+                                "player_b": 1430.0,
+                                "player_c": 1500.0,
                             },
-                            # player_c folds (no VPIP)
-                            {
-                                "street": "preflop",
-                                "actor": "player_c",
-                                "action_type": "fold",
-                                "amount": None,
-                                "pot": 90.0,
-                                "current_bet": 60.0,
-                                "preflop_raise_count": 1,
-                                "stacks": {
-                                    "player_a": 1540.0,
-                                    "player_b": 1370.0,
-                                    "player_c": 1500.0,
-                                },
+                        },
+                        # player_c folds (no VPIP)
+                        {
+                            "street": "preflop",
+                            "actor": "player_c",
+                            "action_type": "fold",
+                            "amount": None,
+                            "pot": 90.0,
+                            "current_bet": 60.0,
+                            "preflop_raise_count": 1,
+                            "stacks": {
+                                "player_a": 1540.0,
+                                "player_b": 1370.0,
+                                "player_c": 1500.0,
                             },
-                        ],
-                    },
-                ],
-                "hand_summaries": [],
-            }
-
-            # Save tournament file
-            tournament_file = gamestates_dir / "tournament_20251213_120000_stats_test.json"
-            with open(tournament_file, "w") as f:
-                json.dump(tournament_data, f)
-
-            # Recalculate stats
-            output_path = Path(tmpdir) / "calibrated_stats.json"
-            kb = recalculate_baseline_stats(
-                gamestates_dir=str(gamestates_dir),
-                output_path=str(output_path),
-            )
+                        },
+                    ],
+                },
+            ],
+            "hand_summaries": [],
+        }
+
+        # Save tournament file
+        tournament_file = gamestates_dir / "tournament_20251213_120000_stats_test.json"
+        with open(tournament_file, "w") as f:
+            json.dump(tournament_data, f)
+
+        # Recalculate stats
+        output_path = tmp_path / "calibrated_stats.json"
+        kb = recalculate_baseline_stats(
+            gamestates_dir=str(gamestates_dir),
+            output_path=str(output_path),
+        )
 
-            # Verify statistics
-            assert "player_a" in kb.profiles
-            assert "player_b" in kb.profiles
-            assert "player_c" in kb.profiles
-
-            # player_a: 1 VPIP out of 2 hands = 50%, 1 PFR out of 2 = 50%
-            stats_a = kb.profiles["player_a"].statistics
-            assert stats_a.hands_played == 2
-            assert stats_a.vpip == 50.0
-            assert stats_a.pfr == 50.0
-
-            # player_b: 2 VPIP out of 2 hands = 100%, 1 PFR out of 2 = 50%
-            stats_b = kb.profiles["player_b"].statistics
-            assert stats_b.hands_played == 2
-            assert stats_b.vpip == 100.0
-            assert stats_b.pfr == 50.0
-
-            # player_c: 0 VPIP out of 2 hands = 0%, 0 PFR
-            stats_c = kb.profiles["player_c"].statistics
-            assert stats_c.hands_played == 2
-            assert stats_c.vpip == 0.0
-            assert stats_c.pfr == 0.0
-
-            # Verify output file was created
-            assert output_path.exists()
-
-    def test_recalculate_empty_directory(self):
+        # Verify statistics
+        assert "player_a" in kb.profiles
+        assert "player_b" in kb.profiles
+        assert "player_c" in kb.profiles
+
+        # player_a: 1 VPIP out of 2 hands = 50%, 1 PFR out of 2 = 50%
+        stats_a = kb.profiles["player_a"].statistics
+        assert stats_a.hands_played == 2
+        assert stats_a.vpip == 50.0
+        assert stats_a.pfr == 50.0
+
+        # player_b: 2 VPIP out of 2 hands = 100%, 1 PFR out of 2 = 50%
+        stats_b = kb.profiles["player_b"].statistics
+        assert stats_b.hands_played == 2
+        assert stats_b.vpip == 100.0
+        assert stats_b.pfr == 50.0
+
+        # player_c: 0 VPIP out of 2 hands = 0%, 0 PFR
+        stats_c = kb.profiles["player_c"].statistics
+        assert stats_c.hands_played == 2
+        assert stats_c.vpip == 0.0
+        assert stats_c.pfr == 0.0
+
+        # Verify output file was created
+        assert output_path.exists()
+
+    def test_recalculate_empty_directory(self, tmp_path):
         """Test recalculation with no tournament files returns empty KnowledgeBase."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            gamestates_dir = Path(tmpdir) / "gamestates"
-            gamestates_dir.mkdir()
-
-            output_path = Path(tmpdir) / "calibrated_stats.json"
-            kb = recalculate_baseline_stats(
-                gamestates_dir=str(gamestates_dir),
-                output_path=str(output_path),
-            )
+        gamestates_dir = tmp_path / "gamestates"
+        gamestates_dir.mkdir()
+
+        output_path = tmp_path / "calibrated_stats.json"
+        kb = recalculate_baseline_stats(
+            gamestates_dir=str(gamestates_dir),
+            output_path=str(output_path),
+        )
 
-            assert len(kb.profiles) == 0
+        assert len(kb.profiles) == 0
 
-    def test_ev_stats_accumulated_during_recalculation(self):
+    def test_ev_stats_accumulated_during_recalculation(self, tmp_path):
         """Test that EV statistics are properly accumulated during recalculation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            gamestates_dir = Path(tmpdir) / "gamestates"
-            gamestates_dir.mkdir()
-
-            tournament_data = {
-                "tournament_id": "ev_test",
-                "timestamp": "20251213_130000",
-                "format_version": 3,
-                "players": ["player_a", "player_b"],
-                "hands": [
+        gamestates_dir = tmp_path / "gamestates"
+        gamestates_dir.mkdir()
+
+        tournament_data = {
+            "tournament_id": "ev_test",
+            "timestamp": "20251213_130000",
+            "format_version": 3,
+            "players": ["player_a", "player_b"],
+            "hands": [
+                {
+                    "hand_number": 1,
+                    "small_blind": 10.0,
+                    "big_blind": 20.0,
+                    "starting_stacks": {"player_a": 1500.0, "player_b": 1500.0},
+                    "finishing_stacks": {"player_a": 2000.0, "player_b": 1000.0},
+                    "actions": [
+                        {
+                            "street": "preflop",
+                            "actor": "player_a",
+                            "action_type": "all_in",
+                            "amount": 1500.0,
+                            "pot": 30.0,
+                            "current_bet": 20.0,
+                            "preflop_raise_count": 0,
+                            "stacks": {"player_a": 1500.0, "player_b": 1500.0},
+                        },
+                        {
+                            "street": "preflop",
+                            "actor": "player_b",
+                            "action_type": "call",
+                            "amount": 1500.0,
+                            "pot": 1530.0,
+                            "current_bet": 1500.0,
+                            "preflop_raise_count": 1,
+                            "stacks": {"player_a": 0.0, "player_b": 1500.0},
+                        },
+                    ],
+                    "ev_records": [
+                        {
+                            "hand_number": 1,
+                            "player_id": "player_a",
+                            "equity": 0.82,
+                            "pot_size": 3000.0,
+                            "amount_invested": 1500.0,
+                            "ev_chips": 960.0,  # (0.82 * 3000) - 1500
+                            "actual_chips": 1500.0,  # Won
+                            "variance": 540.0,
+                            "ev_adjusted": 960.0,
+                        },
+                        {
+                            "hand_number": 1,
+                            "player_id": "player_b",
+                            "equity": 0.18,
+                            "pot_size": 3000.0,
+                            "amount_invested": 1500.0,
+                            "ev_chips": -960.0,  # (0.18 * 3000) - 1500
+                            "actual_chips": -1500.0,  # Lost
+                            "variance": -540.0,
+                            "ev_adjusted": -960.0,
+                        },
+                    ],
+                },
+            ],
+            "hand_summaries": [],
+        }
+
+        tournament_file = gamestates_dir / "tournament_20251213_130000_ev_test.json"
+        with open(tournament_file, "w") as f:
+            json.dump(tournament_data, f)
+
+        output_path = tmp_path / "calibrated_stats.json"
+        kb = recalculate_baseline_stats(
+            gamestates_dir=str(gamestates_dir),
+            output_path=str(output_path),
+        )
+
+        # Verify EV stats
+        stats_a = kb.profiles["player_a"].statistics
+        assert stats_a.showdown_count == 1
+        assert abs(stats_a.ev_adjusted_total - 960.0) < 1.0
+
+        stats_b = kb.profiles["player_b"].statistics
+        assert stats_b.showdown_count == 1
+        assert abs(stats_b.ev_adjusted_total - (-960.0)) < 1.0
+
+    def test_stats_file_freshness_tracks_tournament_files(self, tmp_path):
+        """Test that stats.json is only fresh while newer than every tournament file."""
+        gamestates_dir = tmp_path / "gamestates"
+        gamestates_dir.mkdir()
+        stats_path = tmp_path / "stats.json"
+
+        # No stats file and no tournaments - nothing to reuse
+        assert not is_stats_file_fresh(str(gamestates_dir), str(stats_path))
+
+        tournament_file = gamestates_dir / "tournament_20251213_120000_fresh.json"
+        tournament_file.write_text(
+            json.dumps(
+                {
+                    "tournament_id": "fresh",
+                    "timestamp": "20251213_120000",
+                    "format_version": 3,
+                    "players": ["player_a"],
+                    "hands": [],
+                }
+            )
+        )
+        stats_path.write_text(json.dumps({"profiles": {}}))
+
+        # Stats written after the tournament (and directory) are fresh
+        os.utime(tournament_file, (1_000, 1_000))
+        os.utime(gamestates_dir, (1_000, 1_000))
+        os.utime(stats_path, (2_000, 2_000))
+        assert is_stats_file_fresh(str(gamestates_dir), str(stats_path))
+
+        # A tournament saved after the stats makes them stale
+        os.utime(tournament_file, (3_000, 3_000))
+        assert not is_stats_file_fresh(str(gamestates_dir), str(stats_path))
+
+    def test_recalculation_reuses_cached_tournaments(self, tmp_path, monkeypatch):
+        """Test that unchanged tournaments come from the cache and changed ones are replayed."""
+        gamestates_dir = tmp_path / "gamestates"
+        gamestates_dir.mkdir()
+        stats_path = tmp_path / "stats.json"
+
+        def write_tournament(actions: list[dict]) -> None:
+            (gamestates_dir / "tournament_20251213_120000_cache.json").write_text(
+                json.dumps(
                     {
-                        "hand_number": 1,
-                        "small_blind": 10.0,
-                        "big_blind": 20.0,
-                        "starting_stacks": {"player_a": 1500.0, "player_b": 1500.0},
-                        "finishing_stacks": {"player_a": 2000.0, "player_b": 1000.0},
-                        "actions": [
-                            {
-                                "street": "preflop",
-                                "actor": "player_a",
-                                "action_type": "all_in",
-                                "amount": 1500.0,
-                                "pot": 30.0,
-                                "current_bet": 20.0,
-                                "preflop_raise_count": 0,
-                                "stacks": {"player_a": 1500.0, "player_b": 1500.0},
-                            },
-                            {
-                                "street": "preflop",
-                                "actor": "player_b",
-                                "action_type": "call",
-                                "amount": 1500.0,
-                                "pot": 1530.0,
-                                "current_bet": 1500.0,
-                                "preflop_raise_count": 1,
-                                "stacks": {"player_a": 0.0, "player_b": 1500.0},
-                            },
-                        ],
-                        "ev_records": [
-                            {
-                                "hand_number": 1,
-                                "player_id": "player_a",
-                                "equity": 0.82,
-                                "pot_size": 3000.0,
-                                "amount_invested": 1500.0,
-                                "ev_chips": 960.0,  # (0.82 * 3000) - 1500
-                                "actual_chips": 1500.0,  # Won
-                                "variance": 540.0,
-                                "ev_adjusted": 960.0,
-                            },
-                            {
-                                "hand_number": 1,
-                                "player_id": "player_b",
-                                "equity": 0.18,
-                                "pot_size": 3000.0,
-                                "amount_invested": 1500.0,
-                                "ev_chips": -960.0,  # (0.18 * 3000) - 1500
-                                "actual_chips": -1500.0,  # Lost
-                                "variance": -540.0,
-                                "ev_adjusted": -960.0,
-                            },
-                        ],
-                    },
-                ],
-                "hand_summaries": [],
-            }
-
-            tournament_file = gamestates_dir / "tournament_20251213_130000_ev_test.json"
-            with open(tournament_file, "w") as f:
-                json.dump(tournament_data, f)
-
-            output_path = Path(tmpdir) / "calibrated_stats.json"
-            kb = recalculate_baseline_stats(
-                gamestates_dir=str(gamestates_dir),
-                output_path=str(output_path),
+                        "tournament_id": "cache",
+                        "timestamp": "20251213_120000",
+                        "format_version": 3,
+                        "players": ["player_a", "player_b"],
+                        "hands": [{"hand_number": 1, "big_blind": 20.0, "actions": actions}],
+                    }
+                )
             )
 
-            # Verify EV stats
-            stats_a = kb.profiles["player_a"].statistics
-            assert stats_a.showdown_count == 1
-            assert abs(stats_a.ev_adjusted_total - 960.0) < 1.0
+        raise_action = {
+            "street": "preflop",
+            "actor": "player_a",
+            "action_type": "raise",
+            "amount": 60.0,
+            "pot": 30.0,
+            "current_bet": 20.0,
+            "preflop_raise_count": 0,
+        }
+        write_tournament([raise_action])
+        kb = recalculate_baseline_stats(str(gamestates_dir), str(stats_path))
+        assert kb.profiles["player_a"].statistics.pfr == 100.0
+        assert stats_path.with_suffix(".cache.json").exists()
+
+        # Unchanged file - the counters come from the cache without loading it
+        loads = []
+        load_tournament = GameStateRecorder.load_tournament
+        monkeypatch.setattr(
+            GameStateRecorder,
+            "load_tournament",
+            lambda path: loads.append(path) or load_tournament(path),
+        )
+        kb = recalculate_baseline_stats(str(gamestates_dir), str(stats_path))
+        assert loads == []
+        assert kb.profiles["player_a"].statistics.pfr == 100.0
+        assert kb.profiles["player_b"].statistics.hands_played == 1
 
-            stats_b = kb.profiles["player_b"].statistics
-            assert stats_b.showdown_count == 1
-            assert abs(stats_b.ev_adjusted_total - (-960.0)) < 1.0
+        # Rewritten file - replayed again
+        write_tournament([{**raise_action, "action_type": "call", "amount": 20.0}])
+        kb = recalculate_baseline_stats(str(gamestates_dir), str(stats_path))
+        assert len(loads) == 1
+        assert kb.profiles["player_a"].statistics.pfr == 0.0
+        assert kb.profiles["player_a"].statistics.vpip == 100.0
 
 
 # =============================================================================
@@ -867,6 +965,40 @@ class TestMinimalAction:
         assert action.type == ActionType.RAISE
         assert action.amount == 60.0
 
+    def test_field_order_matches_positional_loader(self):
+        """MinimalAction._from_dict passes the leading fields positionally in this order."""
+        assert [f.name for f in fields(MinimalAction)][:8] == [
+            "hand_number",
+            "street",
+            "actor",
+            "action_type",
+            "amount",
+            "pot",
+            "current_bet",
+            "preflop_raise_count",
+        ]
+
+    def test_dict_round_trip(self):
+        """Every field survives to_dict/from_dict and list_from_dicts."""
+        minimal = MinimalAction(
+            hand_number=7,
+            street="river",
+            actor="player_c",
+            action_type="bet",
+            amount=120.0,
+            pot=300.0,
+            current_bet=0.0,
+            preflop_raise_count=2,
+            stacks={"player_c": 880.0},
+            decision_type="deviate",
+            deviation_reason="Opponent over-folds the river",
+        )
+
+        assert MinimalAction.from_dict(minimal.to_dict()) == minimal
+        assert MinimalAction.list_from_dicts([minimal.to_dict(include_hand_number=False)], 7) == [
+            minimal
+        ]
+
 
 # =============================================================================
 # Integration Tests
@@ -876,73 +1008,69 @@ class TestMinimalAction:
 class TestIntegration:
     """Integration tests for the full history -> statistics -> summary pipeline."""
 
-    def test_full_tournament_recording_and_recalculation(self):
+    def test_full_tournament_recording_and_recalculation(self, tmp_path):
         """Test recording a tournament, saving it, and recalculating statistics."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            gamestates_dir = Path(tmpdir) / "gamestates"
+        gamestates_dir = tmp_path / "gamestates"
 
-            # 1. Record a tournament
-            recorder = GameStateRecorder(gamestates_dir=str(gamestates_dir))
-            recorder.start_tournament("integration_test")
+        # 1. Record a tournament
+        recorder = GameStateRecorder(gamestates_dir=str(gamestates_dir))
+        recorder.start_tournament("integration_test")
 
-            # Hand 1: player_a raises, player_b calls, player_c folds
-            state1 = make_game_state(hand_number=1)
-            recorder.record_action(state1, "player_a", Action(type=ActionType.RAISE, amount=60.0))
+        # Hand 1: player_a raises, player_b calls, player_c folds
+        state1 = make_game_state(hand_number=1)
+        recorder.record_action(state1, "player_a", Action(type=ActionType.RAISE, amount=60.0))
 
-            state1_after_raise = make_game_state(
-                hand_number=1,
-                pot=90.0,
-                current_bet=60.0,
-                action_history=[{"street": "preflop", "action": "raise"}],
-            )
-            recorder.record_action(
-                state1_after_raise, "player_b", Action(type=ActionType.CALL, amount=60.0)
-            )
-            recorder.record_action(state1_after_raise, "player_c", Action(type=ActionType.FOLD))
-            recorder.record_hand_result(
-                {"player_a": 1560.0, "player_b": 1440.0, "player_c": 1500.0}
-            )
+        state1_after_raise = make_game_state(
+            hand_number=1,
+            pot=90.0,
+            current_bet=60.0,
+            action_history=[{"street": "preflop", "action": "raise"}],
+        )
+        recorder.record_action(
+            state1_after_raise, "player_b", Action(type=ActionType.CALL, amount=60.0)
+        )
+        recorder.record_action(state1_after_raise, "player_c", Action(type=ActionType.FOLD))
+        recorder.record_hand_result({"player_a": 1560.0, "player_b": 1440.0, "player_c": 1500.0})
+
+        # Hand 2: player_b raises, others fold
+        state2 = make_game_state(hand_number=2)
+        recorder.record_action(state2, "player_a", Action(type=ActionType.FOLD))
+        recorder.record_action(state2, "player_b", Action(type=ActionType.RAISE, amount=60.0))
+        recorder.record_action(state2, "player_c", Action(type=ActionType.FOLD))
+        recorder.record_hand_result({"player_a": 1560.0, "player_b": 1470.0, "player_c": 1470.0})
+
+        # 2. Save tournament
+        filepath = recorder.save_tournament()
+        assert filepath is not None
+
+        # 3. Load and verify tournament structure, parsing the file once
+        # (recalculation below goes through load_tournament itself)
+        data = json.loads(Path(filepath).read_text())
+        loaded = TournamentRecord.from_dict(data)
+        assert len(loaded.hands) == 2
+        assert len(loaded.hands[0].actions) == 3
+        assert len(loaded.hands[1].actions) == 3
 
-            # Hand 2: player_b raises, others fold
-            state2 = make_game_state(hand_number=2)
-            recorder.record_action(state2, "player_a", Action(type=ActionType.FOLD))
-            recorder.record_action(state2, "player_b", Action(type=ActionType.RAISE, amount=60.0))
-            recorder.record_action(state2, "player_c", Action(type=ActionType.FOLD))
-            recorder.record_hand_result(
-                {"player_a": 1560.0, "player_b": 1470.0, "player_c": 1470.0}
-            )
+        # 4. Verify hand summaries
+        assert "hand_summaries" in data
+        assert len(data["hand_summaries"]) == 2
 
-            # 2. Save tournament
-            filepath = recorder.save_tournament()
-            assert filepath is not None
-
-            # 3. Load and verify tournament structure
-            loaded = GameStateRecorder.load_tournament(filepath)
-            assert len(loaded.hands) == 2
-            assert len(loaded.hands[0].actions) == 3
-            assert len(loaded.hands[1].actions) == 3
-
-            # 4. Verify hand summaries
-            data = json.loads(Path(filepath).read_text())
-            assert "hand_summaries" in data
-            assert len(data["hand_summaries"]) == 2
-
-            # 5. Recalculate statistics
-            output_path = Path(tmpdir) / "stats.json"
-            kb = recalculate_baseline_stats(
-                gamestates_dir=str(gamestates_dir),
-                output_path=str(output_path),
-            )
+        # 5. Recalculate statistics
+        output_path = tmp_path / "stats.json"
+        kb = recalculate_baseline_stats(
+            gamestates_dir=str(gamestates_dir),
+            output_path=str(output_path),
+        )
 
-            # 6. Verify recalculated stats
-            assert kb.profiles["player_a"].statistics.hands_played == 2
-            assert kb.profiles["player_b"].statistics.hands_played == 2
-            assert kb.profiles["player_c"].statistics.hands_played == 2
+        # 6. Verify recalculated stats
+        assert kb.profiles["player_a"].statistics.hands_played == 2
+        assert kb.profiles["player_b"].statistics.hands_played == 2
+        assert kb.profiles["player_c"].statistics.hands_played == 2
 
-            # player_a: raised hand 1, folded hand 2 -> VPIP 50%, PFR 50%
-            assert kb.profiles["player_a"].statistics.vpip == 50.0
-            assert kb.profiles["player_a"].statistics.pfr == 50.0
+        # player_a: raised hand 1, folded hand 2 -> VPIP 50%, PFR 50%
+        assert kb.profiles["player_a"].statistics.vpip == 50.0
+        assert kb.profiles["player_a"].statistics.pfr == 50.0
 
-            # player_b: called hand 1, raised hand 2 -> VPIP 100%, PFR 50%
-            assert kb.profiles["player_b"].statistics.vpip == 100.0
-            assert kb.profiles["player_b"].statistics.pfr == 50.0
+        # player_b: called hand 1, raised hand 2 -> VPIP 100%, PFR 50%
+        assert kb.profiles["player_b"].statistics.vpip == 100.0
+        assert kb.profiles["player_b"].statistics.pfr == 50.0